@@ -0,0 +1,205 @@
+#ini file animation_writer.py
+"""
+AnimationWriter - Tulis frame langsung ke satu file animasi secara streaming
+Format: GIF (palette tetap kubus warna), APNG, atau raw RGB24 untuk encoder eksternal
+Setiap frame langsung ditulis ke file; tidak ada frame yang ditahan di memori
+"""
+import os
+import struct
+import zlib
+
+import numpy as np
+
+
+class AnimationWriter:
+    """Base class writer animasi: write(pixel) per frame, close() di akhir"""
+
+    extension = ""
+
+    def __init__(self, path, fps=12):
+        self.path = path
+        self.fps = fps
+        self.frames = 0
+        self.size = None
+        self._file = open(path, "wb")
+
+    def write(self, pixel):
+        """Tulis satu frame (height, width, 3) uint8"""
+        pixel = np.ascontiguousarray(pixel, dtype=np.uint8)
+        size = pixel.shape[:2]
+        if self.size is None:
+            self.size = size
+            self._write_header(pixel)
+        elif size != self.size:
+            raise ValueError(f"Frame size {size} differs from animation size {self.size}")
+        self._write_frame(pixel)
+        self.frames += 1
+
+    def close(self):
+        if self._file.closed:
+            return
+        try:
+            if self.frames > 0:
+                self._write_trailer()
+        finally:
+            self._file.close()
+
+    def _write_header(self, pixel):
+        pass
+
+    def _write_frame(self, pixel):
+        raise NotImplementedError
+
+    def _write_trailer(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class RawVideoWriter(AnimationWriter):
+    """
+    Stream RGB24 mentah (frame demi frame, tanpa header)
+
+    Path boleh berupa named pipe agar bisa langsung dibaca encoder, mis:
+        ffmpeg -f rawvideo -pix_fmt rgb24 -s 640x480 -r 12 -i rocket_animation.rgb out.mp4
+    """
+
+    extension = ".rgb"
+
+    def _write_frame(self, pixel):
+        self._file.write(pixel.tobytes())
+
+    def encoder_hint(self):
+        if self.size is None:
+            return None
+        height, width = self.size
+        return (f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {width}x{height} -r {self.fps} "
+                f"-i {self.path} rocket_animation.mp4")
+
+
+class GifWriter(AnimationWriter):
+    """
+    Animated GIF (loop) dengan satu global palette
+
+    Palette tetap berupa kubus warna seragam 6x7x6 (252 warna, hijau paling
+    halus karena mata paling peka), jadi warna frame mana pun punya entry
+    terdekat dan setiap frame bisa di-encode dan ditulis langsung.
+    """
+
+    extension = ".gif"
+    levels = (6, 7, 6)
+
+    def __init__(self, path, fps=12):
+        super().__init__(path, fps)
+        levels = np.array(self.levels)
+        # Entry palette ke-i = (r, g, b) dengan i = (r * 7 + g) * 6 + b
+        grid = np.stack(np.meshgrid(*[np.arange(n) for n in self.levels], indexing="ij"), axis=-1)
+        cube = np.rint(grid.reshape(-1, 3) * 255 / (levels - 1)).astype(np.uint8)
+        self._palette = np.zeros((256, 3), dtype=np.uint8)
+        self._palette[:len(cube)] = cube
+        self._scale = (levels - 1) / 255
+        self._stride = np.array([self.levels[1] * self.levels[2], self.levels[2], 1])
+
+    def quantize(self, pixel):
+        """Index palette (height, width) uint8 dari warna kubus terdekat per channel"""
+        level = np.rint(pixel * self._scale).astype(np.uint8)
+        return (level @ self._stride).astype(np.uint8)
+
+    def _image(self, pixel):
+        from PIL import Image
+
+        image = Image.fromarray(self.quantize(pixel), mode="P")
+        image.putpalette(self._palette.tobytes())
+        return image
+
+    def _write_header(self, pixel):
+        from PIL import GifImagePlugin
+
+        header, _ = GifImagePlugin.getheader(self._image(pixel), info={"loop": 0})
+        self._file.write(b"".join(header))
+
+    def _write_frame(self, pixel):
+        from PIL import GifImagePlugin
+
+        duration = int(round(1000 / self.fps))
+        for block in GifImagePlugin.getdata(self._image(pixel), duration=duration):
+            self._file.write(block)
+
+    def _write_trailer(self):
+        self._file.write(b";")
+
+
+class ApngWriter(AnimationWriter):
+    """
+    Animated PNG (lossless, loop)
+
+    Setiap frame dikompres (filter Up + zlib) dan langsung ditulis sebagai
+    chunk fcTL + IDAT/fdAT. Jumlah frame di chunk acTL diperbarui saat close().
+    """
+
+    extension = ".png"
+
+    def __init__(self, path, fps=12, compress_level=6):
+        super().__init__(path, fps)
+        self.compress_level = compress_level
+        self._sequence = 0
+        self._actl_offset = None
+
+    def _chunk(self, chunk_type, data):
+        self._file.write(struct.pack(">I", len(data)) + chunk_type + data +
+                         struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+    def _write_header(self, pixel):
+        height, width = pixel.shape[:2]
+        self._file.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        self._actl_offset = self._file.tell()
+        self._chunk(b"acTL", struct.pack(">II", 0, 0))
+
+    def _write_frame(self, pixel):
+        height, width = pixel.shape[:2]
+        self._chunk(b"fcTL", struct.pack(">IIIIIHHBB", self._sequence, width, height, 0, 0,
+                                         1, self.fps, 0, 0))
+        self._sequence += 1
+
+        # Filter Up (tipe 2): selisih dengan baris di atasnya (uint8 wrap = mod 256)
+        rows = pixel.reshape(height, width * 3)
+        filtered = np.empty((height, width * 3 + 1), dtype=np.uint8)
+        filtered[:, 0] = 2
+        filtered[0, 1:] = rows[0]
+        np.subtract(rows[1:], rows[:-1], out=filtered[1:, 1:])
+        data = zlib.compress(filtered.tobytes(), self.compress_level)
+
+        if self.frames == 0:
+            self._chunk(b"IDAT", data)
+        else:
+            self._chunk(b"fdAT", struct.pack(">I", self._sequence) + data)
+            self._sequence += 1
+
+    def _write_trailer(self):
+        self._chunk(b"IEND", b"")
+        # Tulis ulang acTL dengan jumlah frame sebenarnya (num_plays 0 = loop)
+        self._file.seek(self._actl_offset)
+        self._chunk(b"acTL", struct.pack(">II", self.frames, 0))
+        self._file.seek(0, os.SEEK_END)
+
+
+ANIMATION_FORMATS = {
+    "gif": GifWriter,
+    "apng": ApngWriter,
+    "raw": RawVideoWriter
+}
+
+
+def open_animation(fmt, basename="rocket_animation", fps=12):
+    """Buka writer animasi di folder result/ (fmt: gif, apng atau raw)"""
+    if fmt not in ANIMATION_FORMATS:
+        raise ValueError(f"Unknown animation format: {fmt!r} (expected one of {sorted(ANIMATION_FORMATS)})")
+    writer_class = ANIMATION_FORMATS[fmt]
+    os.makedirs("result", exist_ok=True)
+    return writer_class(os.path.join("result", basename + writer_class.extension), fps=fps)
@@ -0,0 +1,49 @@
+"""
+Benchmark - RocketModel.build (vectorized) vs RocketModel.build_reference (loop per voxel)
+
+Sekaligus memverifikasi bahwa grid voxel yang dihasilkan byte-identik.
+Jalankan dari root project:
+    python benchmarks/bench_build.py [--skip-reference]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import RocketModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RocketModel.build")
+    parser.add_argument("--skip-reference", action="store_true",
+                        help="Jangan jalankan build loop referensi (lambat)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    voxels = RocketModel(col=320, row=450, length=320).build()
+    vec_time = time.perf_counter() - t0
+    print(f"build (vectorized): {vec_time:.3f}s, {len(voxels)} voxels")
+
+    if args.skip_reference:
+        return
+
+    t0 = time.perf_counter()
+    reference = RocketModel(col=320, row=450, length=320).build_reference()
+    ref_time = time.perf_counter() - t0
+    print(f"build_reference (loop): {ref_time:.3f}s")
+    print(f"Speedup: {ref_time / vec_time:.1f}x")
+
+    if np.array_equal(voxels.to_dense(), reference.to_dense()):
+        print("✓ Voxel grid byte-identical")
+    else:
+        diff = np.any(voxels.to_dense() != reference.to_dense(), axis=3).sum()
+        print(f"✗ Voxel grid berbeda di {diff} sel")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark - frustum culling per brick (Renderer.brick_culling) on vs off
+
+Kamera menyapu dari objek di tengah layar ke objek yang sebagian / seluruhnya
+di luar layar. Hasil render harus identik; waktu dan statistik cull dicetak.
+
+Jalankan dari root project:
+    python benchmarks/bench_culling.py [--frames 12 --width 1280 --height 720 --surface]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import load_or_build
+from frame_renderer import make_renderer, render_job
+
+
+def make_jobs(n_frames):
+    """Objek bergeser dari tengah ke luar layar kanan (deterministik)"""
+    return [{
+        "index": i,
+        "translation": [450.0 * i / max(1, n_frames - 1), 0.0, 0.0],
+        "rotation": {"pitch": 15.0, "yaw": 30.0},
+        "cam_trans": [0.0, 0.0, -300.0],
+        "cam_rot": {"pitch": 0.0, "yaw": 0.0}
+    } for i in range(n_frames)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark brick frustum culling")
+    parser.add_argument("--frames", type=int, default=12)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--surface", action="store_true", help="Render kulit model saja (opt-in, approximate), bukan model solid")
+    args = parser.parse_args()
+
+    cache_data, _ = load_or_build()
+    voxel_data, centroid = cache_data["surface" if args.surface else "voxels"], cache_data["centroid"]
+
+    renderer = make_renderer({"width": args.width, "height": args.height, "fov": 50})
+    print(f"{args.frames} frames @ {args.width}x{args.height}, {len(voxel_data.bricks())} bricks")
+    totals = {True: 0.0, False: 0.0}
+    for job in make_jobs(args.frames):
+        images = {}
+        for culling in (False, True):
+            renderer.brick_culling = culling
+            stats = {}
+            t0 = time.perf_counter()
+            images[culling] = render_job(renderer, voxel_data, centroid, job, stats)
+            totals[culling] += time.perf_counter() - t0
+        same = np.array_equal(images[True], images[False])
+        print(f"  x={job['translation'][0]:6.1f}: {stats['bricks_culled']:5d}/{stats['bricks']} bricks, "
+              f"{stats['culled']:7d} voxels culled  {'identical' if same else 'MISMATCH'}")
+    print(f"  culling off: {totals[False]:.2f}s   culling on: {totals[True]:.2f}s   "
+          f"speedup {totals[False] / totals[True]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark - piramida LOD (canvas.lod) vs detail penuh pada berbagai jarak kamera
+
+Untuk setiap jarak dicetak level LOD terpilih, waktu render dan selisih
+gambar terhadap render detail penuh (persentase pixel berbeda, rata-rata
+selisih warna).
+
+Jalankan dari root project:
+    python benchmarks/bench_lod.py [--lod 1.0 --distances 300 600 1200 2500 5000 --surface]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import load_or_build
+from frame_renderer import make_renderer, render_job
+
+
+def timed_render(renderer, voxel_data, centroid, job, repeat):
+    stats = {}
+    render_job(renderer, voxel_data, centroid, job)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        pixel = render_job(renderer, voxel_data, centroid, job, stats)
+    return pixel, (time.perf_counter() - t0) / repeat, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LOD level selection")
+    parser.add_argument("--lod", type=float, default=1.0, help="canvas.lod yang diuji")
+    parser.add_argument("--distances", type=float, nargs="+", default=[300, 600, 1200, 2500, 5000])
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--surface", action="store_true", help="Render kulit model saja (opt-in, approximate), bukan model solid")
+    args = parser.parse_args()
+
+    cache_data, _ = load_or_build()
+    voxel_data, centroid = cache_data["surface" if args.surface else "voxels"], cache_data["centroid"]
+
+    canvas = {"width": args.width, "height": args.height, "fov": 50}
+    full = make_renderer(dict(canvas, lod=0.0))
+    lod = make_renderer(dict(canvas, lod=args.lod))
+    print(f"{args.width}x{args.height}, lod={args.lod}, levels: 1x {len(voxel_data)} voxels, " +
+          ", ".join(f"{f}x {len(level)}" for f, level in sorted(voxel_data.lods.items())))
+    for distance in args.distances:
+        job = {"translation": [0.0, 0.0, 0.0], "rotation": {"pitch": 15.0, "yaw": 30.0},
+               "cam_trans": [0.0, 0.0, -distance], "cam_rot": {"pitch": 0.0, "yaw": 0.0}}
+        reference, t_full, _ = timed_render(full, voxel_data, centroid, job, args.repeat)
+        pixel, t_lod, stats = timed_render(lod, voxel_data, centroid, job, args.repeat)
+        diff = np.abs(reference.astype(np.int16) - pixel)
+        print(f"  distance {distance:6.0f}: level {stats['lod']}x  full {t_full * 1000:7.1f} ms  "
+              f"lod {t_lod * 1000:7.1f} ms  ({t_full / t_lod:5.1f}x)  "
+              f"{diff.any(axis=2).mean() * 100:5.2f}% px differ, mean diff {diff.mean():.3f}")
+
+
+if __name__ == "__main__":
+    main()
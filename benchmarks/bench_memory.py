@@ -0,0 +1,75 @@
+"""
+Benchmark - peak memory render_with_config terhadap jumlah frame
+
+Setiap jumlah frame dijalankan di proses Python baru (di directory sementara
+yang memakai cache model project). Peak RSS harus tetap datar saat jumlah
+frame naik: frame tidak ditahan setelah ditulis, hanya frame composite.
+
+Jalankan dari root project:
+    python benchmarks/bench_memory.py [--frames 4 16 64 --width 1280 --height 720 --workers 1]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import contextlib, io, json, os, resource, sys, tempfile
+sys.path.insert(0, {root!r})
+from config_manager import ConfigManager
+import main
+
+config = ConfigManager()
+config.add_animation_point([0, 0, 0], pitch=0, yaw=0)
+config.add_animation_point([0, 0, 0], pitch=0, yaw=180)
+config.set_camera_settings([0, 0, -400])
+config.set_canvas_settings({width}, {height})
+config.set_render_settings({frames})
+
+with tempfile.TemporaryDirectory() as workdir:
+    os.symlink(os.path.join({root!r}, "cache"), os.path.join(workdir, "cache"))
+    os.chdir(workdir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        main.render_with_config(config, workers={workers})
+
+print(json.dumps({{
+    "main_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "workers_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+}}))
+"""
+
+
+def measure(frames, width, height, workers):
+    code = PROBE.format(root=ROOT, frames=frames, width=width, height=height, workers=workers)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark peak memory vs frame count")
+    parser.add_argument("--frames", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from rocket_model import load_or_build
+    load_or_build()
+
+    frame_mb = args.width * args.height * 3 / 1024 / 1024
+    print(f"{args.width}x{args.height} ({frame_mb:.1f} MB/frame), workers={args.workers}")
+    first = None
+    for frames in args.frames:
+        result = measure(frames, args.width, args.height, args.workers)
+        first = first or result
+        growth = result["main_mb"] - first["main_mb"]
+        print(f"  frames={frames:4d}: peak main {result['main_mb']:7.1f} MB  "
+              f"workers {result['workers_mb']:7.1f} MB  (+{growth:.1f} MB vs first)")
+
+
+if __name__ == "__main__":
+    main()
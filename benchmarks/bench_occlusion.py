@@ -0,0 +1,57 @@
+"""
+Benchmark - occlusion culling (brick depan-ke-belakang + Hi-Z) vs render biasa
+
+Untuk setiap jarak kamera (default close-up, splat hingga 20x20 pixel)
+dicetak overdraw (fragment per pixel tertutup) sebelum dan sesudah, jumlah
+brick yang dilewati, waktu render dan apakah gambarnya identik.
+
+Jalankan dari root project:
+    python benchmarks/bench_occlusion.py [--distances 40 80 150 300 --surface]
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import load_or_build
+from frame_renderer import make_renderer
+from bench_lod import timed_render
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark occlusion culling")
+    parser.add_argument("--distances", type=float, nargs="+", default=[40, 80, 150, 300])
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--surface", action="store_true", help="Render kulit model saja (opt-in, approximate), bukan model solid")
+    args = parser.parse_args()
+
+    cache_data, _ = load_or_build()
+    voxel_data = cache_data["surface" if args.surface else "voxels"]
+    centroid = cache_data["centroid"]
+
+    # lod=0: detail penuh, supaya yang diukur hanya efek occlusion culling
+    canvas = {"width": args.width, "height": args.height, "fov": 50, "lod": 0.0}
+    plain = make_renderer(dict(canvas, occlusion=False))
+    occlusion = make_renderer(dict(canvas, occlusion=True))
+    print(f"{args.width}x{args.height}, {len(voxel_data)} voxels in {len(voxel_data.bricks())} bricks "
+          f"({'surface' if args.surface else 'solid'})")
+    for distance in args.distances:
+        job = {"translation": [0.0, 0.0, 0.0], "rotation": {"pitch": 15.0, "yaw": 30.0},
+               "cam_trans": [0.0, 0.0, -distance], "cam_rot": {"pitch": 0.0, "yaw": 0.0}}
+        reference, t_plain, before = timed_render(plain, voxel_data, centroid, job, args.repeat)
+        pixel, t_occlusion, after = timed_render(occlusion, voxel_data, centroid, job, args.repeat)
+        pixels = max(before["pixels"], 1)
+        print(f"  distance {distance:6.0f}: overdraw {before['fragments'] / pixels:6.2f} -> "
+              f"{after['fragments'] / pixels:6.2f}  "
+              f"{after['bricks_occluded']:4d}/{after['bricks']} bricks occluded  "
+              f"plain {t_plain * 1000:7.1f} ms  occlusion {t_occlusion * 1000:7.1f} ms  "
+              f"({t_plain / t_occlusion:4.2f}x)  identical={np.array_equal(reference, pixel)}")
+
+
+if __name__ == "__main__":
+    main()
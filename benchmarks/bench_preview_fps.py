@@ -0,0 +1,53 @@
+"""
+Benchmark - frame per detik show_camera_setup_realtime berulang (preview GUI)
+
+Mensimulasikan spinbox kamera yang digeser: setiap panggilan memutar kamera
+sedikit. Dibandingkan retained mode dengan blitting vs draw penuh setiap
+update (Visualizer.use_blit = False). Dijalankan headless (backend Agg,
+kecuali MPLBACKEND sudah di-set) sehingga angka mengukur kerja matplotlib
+tanpa event loop GUI.
+
+Jalankan dari root project:
+    python benchmarks/bench_preview_fps.py [--updates 30]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from visualizer import Visualizer
+
+
+def measure_fps(visualizer, updates):
+    """Panggil show_camera_setup_realtime updates kali (kamera berputar), return fps"""
+    visualizer.show_camera_setup_realtime([0, 0, 0], {"x": 0, "y": 0})
+    start = time.perf_counter()
+    for n in range(updates):
+        visualizer.set_camera_position(0.0, 0.0, -150.0 - n)
+        visualizer.set_camera_rotation(n % 20, (3 * n) % 40)
+        visualizer.show_camera_setup_realtime([0, 0, 0], {"x": n % 30, "y": (5 * n) % 360})
+    return updates / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark preview frames per second")
+    parser.add_argument("--updates", type=int, default=30)
+    args = parser.parse_args()
+
+    visualizer = Visualizer()
+    results = {}
+    for blit in (False, True):
+        visualizer.close()
+        visualizer.use_blit = blit
+        results[blit] = measure_fps(visualizer, args.updates)
+        mode = "retained + blit" if blit else "retained, full draw"
+        print(f"  {mode:20s}: {results[blit]:6.2f} fps  ({1000 / results[blit]:6.1f} ms/update)")
+    visualizer.close()
+    print(f"  blit speedup: {results[True] / results[False]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark - rasterizer tile + thread pool (canvas.threads) vs satu thread
+
+Untuk setiap jumlah thread dicetak waktu stage raster dan total render
+(rata-rata beberapa pose close-up dan jauh), speedup terhadap 1 thread dan
+apakah gambarnya identik. Speedup hanya terlihat jika mesin punya >1 core.
+
+Jalankan dari root project:
+    python benchmarks/bench_raster_threads.py [--threads 1 2 4 8 --width 1920 --height 1080 --surface]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import load_or_build
+from frame_renderer import make_renderer, render_job
+
+POSES = [
+    {"translation": [0.0, 0.0, 0.0], "rotation": {"pitch": 15.0, "yaw": 30.0},
+     "cam_trans": [0.0, 0.0, -distance], "cam_rot": {"pitch": 0.0, "yaw": 0.0}}
+    for distance in (60, 150, 400)
+]
+
+
+def default_threads():
+    counts, n = [], 1
+    while n < (os.cpu_count() or 1):
+        counts.append(n)
+        n *= 2
+    return counts + [os.cpu_count() or 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multithreaded tile rasterizer")
+    parser.add_argument("--threads", type=int, nargs="+", default=default_threads())
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--surface", action="store_true", help="Render kulit model saja (opt-in, approximate), bukan model solid")
+    args = parser.parse_args()
+
+    cache_data, _ = load_or_build()
+    voxel_data, centroid = cache_data["surface" if args.surface else "voxels"], cache_data["centroid"]
+
+    canvas = {"width": args.width, "height": args.height, "fov": 50, "lod": 0.0, "occlusion": True}
+    print(f"{args.width}x{args.height}, {len(POSES)} poses, {os.cpu_count()} CPU(s)")
+    references = None
+    baseline = None
+    for threads in args.threads:
+        with make_renderer(dict(canvas, threads=threads)) as renderer:
+            render_job(renderer, voxel_data, centroid, POSES[0])
+            raster = total = 0.0
+            images = []
+            for job in POSES:
+                for _ in range(args.repeat):
+                    stats = {}
+                    t0 = time.perf_counter()
+                    pixel = render_job(renderer, voxel_data, centroid, job, stats)
+                    total += time.perf_counter() - t0
+                    raster += stats["raster"]
+                images.append(pixel)
+        runs = len(POSES) * args.repeat
+        raster, total = raster / runs, total / runs
+        references = references or images
+        baseline = baseline or raster
+        identical = all(np.array_equal(a, b) for a, b in zip(references, images))
+        print(f"  threads {threads:3d}: raster {raster * 1000:7.1f} ms  total {total * 1000:7.1f} ms  "
+              f"raster speedup {baseline / raster:4.2f}x  identical={identical}")
+
+
+if __name__ == "__main__":
+    main()
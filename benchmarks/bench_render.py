@@ -0,0 +1,67 @@
+"""
+Benchmark - Renderer.render (vectorized) vs Renderer.render_reference (loop per voxel)
+
+Jalankan dari root project:
+    python benchmarks/bench_render.py [--width 640 --height 480 --repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import load_or_build
+from transform import Transform
+from camera import Camera
+from renderer import Renderer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Renderer.render")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-reference", action="store_true",
+                        help="Jangan jalankan loop referensi (lambat)")
+    args = parser.parse_args()
+
+    cache_data, _ = load_or_build()
+    voxel_data, centroid = cache_data["voxels"], cache_data["centroid"]
+    cx, cy, cz = centroid
+
+    camera = Camera((cx, cy, cz - 150), (cx, cy, cz), {"x": 0, "y": 0, "z": 0})
+    transform = Transform()
+    transform.set_rotation_degrees(yaw=30, pitch=15, roll=0)
+
+    renderer = Renderer(width=args.width, height=args.height, fov=50, threshold=10)
+
+    times = []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        pixel = renderer.render(voxel_data, camera, transform, centroid)
+        times.append(time.perf_counter() - t0)
+    vec_time = min(times)
+    print(f"render (vectorized): {vec_time:.3f}s (best of {args.repeat})")
+
+    if args.skip_reference:
+        return
+
+    t0 = time.perf_counter()
+    reference = renderer.render_reference(voxel_data, camera, transform, centroid)
+    ref_time = time.perf_counter() - t0
+    print(f"render_reference (loop): {ref_time:.3f}s")
+    print(f"Speedup: {ref_time / vec_time:.1f}x")
+
+    if np.array_equal(pixel, reference):
+        print("✓ Output pixel-identical")
+    else:
+        diff = np.any(pixel != reference, axis=2).sum()
+        print(f"✗ Output berbeda di {diff} pixel")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
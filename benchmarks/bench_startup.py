@@ -0,0 +1,69 @@
+"""
+Benchmark - cold-start import time untuk mode `python main.py render`
+
+Membandingkan:
+  - render: `import main` saja (GUI di-import lazy, hanya saat GUI dibuka)
+  - eager:  `import main` + `import gui_input` (perilaku lama: PyQt6,
+            backend Qt matplotlib dan visualizer/TkAgg ikut dimuat)
+  - eager visualizer: `import main` + `import visualizer` (bagian non-Qt
+            dari perilaku lama, berguna jika PyQt6 tidak terpasang)
+
+Setiap sampel dijalankan di proses Python baru.
+Jalankan dari root project:
+    python benchmarks/bench_startup.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["PyQt6", "matplotlib", "matplotlib.pyplot", "tkinter", "visualizer", "gui_input"]
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(imports, repeat):
+    """Jalankan probe di subprocess, kembalikan (waktu terbaik, modul berat yang termuat)"""
+    code = PROBE.format(imports=imports, heavy=HEAVY_MODULES)
+    best, loaded = None, []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            return None, proc.stderr.strip().splitlines()[-1]
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        best = result["elapsed"] if best is None else min(best, result["elapsed"])
+        loaded = result["loaded"]
+    return best, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold-start import time")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("render (lazy GUI)", "import main"),
+        ("eager GUI import", "import main\nimport gui_input"),
+        # Tanpa PyQt6 terpasang: minimal biaya pyplot + TkAgg dari visualizer
+        ("eager visualizer", "import main\nimport visualizer"),
+    ]
+    for label, imports in cases:
+        elapsed, loaded = measure(imports, args.repeat)
+        if elapsed is None:
+            print(f"{label:20s}: gagal ({loaded})")
+        else:
+            print(f"{label:20s}: {elapsed * 1000:8.1f} ms  heavy modules: {', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
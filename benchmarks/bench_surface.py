@@ -0,0 +1,66 @@
+"""
+Benchmark - render kulit model (surface) vs model solid pada pose acak
+
+Kamera selalu di luar objek. Untuk setiap pose dicetak jumlah pixel yang
+berbeda dan waktu render keduanya. Kulit bukan pengganti pixel-identik:
+celah 1 pixel antar splat bisa memperlihatkan voxel dalam di model solid.
+
+Jalankan dari root project:
+    python benchmarks/bench_surface.py [--poses 40 --width 640 --height 480 --seed 0]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import load_or_build
+from frame_renderer import make_renderer, render_job
+
+
+def make_jobs(n_poses, seed):
+    """Pose acak (deterministik per seed): rotasi bebas, jarak kamera 150-700"""
+    rng = np.random.default_rng(seed)
+    return [{
+        "index": i,
+        "translation": [float(rng.uniform(-30, 30)), float(rng.uniform(-30, 30)), 0.0],
+        "rotation": {"pitch": float(rng.uniform(-180, 180)), "yaw": float(rng.uniform(-180, 180))},
+        "cam_trans": [0.0, 0.0, -float(rng.uniform(150, 700))],
+        "cam_rot": {"pitch": 0.0, "yaw": 0.0}
+    } for i in range(n_poses)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare surface shell and solid renders")
+    parser.add_argument("--poses", type=int, default=40)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cache_data, _ = load_or_build()
+    centroid = cache_data["centroid"]
+    renderer = make_renderer({"width": args.width, "height": args.height, "fov": 50, "lod": 0.0})
+    print(f"{args.poses} poses @ {args.width}x{args.height}: surface {len(cache_data['surface'])} "
+          f"vs solid {len(cache_data['voxels'])} voxels")
+
+    times = {"surface": 0.0, "voxels": 0.0}
+    differing = 0
+    for job in make_jobs(args.poses, args.seed):
+        images = {}
+        for name in times:
+            t0 = time.perf_counter()
+            images[name] = render_job(renderer, cache_data[name], centroid, job)
+            times[name] += time.perf_counter() - t0
+        diff = int(np.any(images["surface"] != images["voxels"], axis=2).sum())
+        differing += diff > 0
+        print(f"  pose {job['index']:3d} cam z {job['cam_trans'][2]:7.1f}: {diff:6d} pixels differ")
+    print(f"  {differing}/{args.poses} poses differ   solid: {times['voxels']:.2f}s   "
+          f"surface: {times['surface']:.2f}s   speedup {times['voxels'] / times['surface']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
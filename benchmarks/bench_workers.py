@@ -0,0 +1,60 @@
+"""
+Benchmark - skala render multi-frame dengan process pool (1/2/4/8 workers)
+
+Jalankan dari root project:
+    python benchmarks/bench_workers.py [--frames 16 --workers 1 2 4 8 --surface]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import load_or_build
+from frame_renderer import render_frames
+
+
+def make_jobs(n_frames):
+    """Orbit kamera sederhana di sekitar roket (deterministik)"""
+    jobs = []
+    for i in range(n_frames):
+        jobs.append({
+            "index": i,
+            "translation": [0.0, 0.0, 0.0],
+            "rotation": {"pitch": 0.0, "yaw": 360.0 * i / n_frames},
+            "cam_trans": [0.0, 0.0, -300.0],
+            "cam_rot": {"pitch": 0.0, "yaw": 0.0}
+        })
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel frame rendering")
+    parser.add_argument("--frames", type=int, default=16)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--surface", action="store_true", help="Render kulit model saja (opt-in, approximate), bukan model solid")
+    args = parser.parse_args()
+
+    cache_data, _ = load_or_build()
+    voxel_data = cache_data["surface" if args.surface else "voxels"]
+
+    canvas = {"width": args.width, "height": args.height, "fov": 50}
+    jobs = make_jobs(args.frames)
+    print(f"{args.frames} frames @ {args.width}x{args.height}, {os.cpu_count()} CPU(s)")
+
+    baseline = None
+    for workers in args.workers:
+        t0 = time.perf_counter()
+        for _ in render_frames(jobs, voxel_data, cache_data["centroid"], canvas, workers=workers,
+                               surface_only=args.surface):
+            pass
+        elapsed = time.perf_counter() - t0
+        baseline = baseline or elapsed
+        print(f"  workers={workers}: {elapsed:7.2f}s  {args.frames / elapsed:6.2f} fps  speedup {baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark - render + encode JPEG sinkron vs FrameWriter (encode di background thread)
+
+Dengan writer, waktu total mendekati max(render, encode) per frame,
+bukan jumlah keduanya (butuh >1 CPU agar benar-benar overlap).
+
+Jalankan dari root project:
+    python benchmarks/bench_writer.py [--frames 16 --width 1280 --height 720 --surface]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import load_or_build
+from frame_renderer import make_renderer, render_frames, render_job
+from frame_writer import FrameWriter
+from bench_workers import make_jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark asynchronous frame writing")
+    parser.add_argument("--frames", type=int, default=16)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--max-pending", type=int, default=4)
+    parser.add_argument("--surface", action="store_true", help="Render kulit model saja (opt-in, approximate), bukan model solid")
+    args = parser.parse_args()
+
+    cache_data, _ = load_or_build()
+
+    canvas = {"width": args.width, "height": args.height, "fov": 50}
+    renderer = make_renderer(canvas)
+    jobs = make_jobs(args.frames)
+    voxel_data, centroid = cache_data["surface" if args.surface else "voxels"], cache_data["centroid"]
+    print(f"{args.frames} frames @ {args.width}x{args.height}, {os.cpu_count()} CPU(s)")
+
+    def write_frame(index, pixel):
+        return renderer.save_image(pixel, f"bench_frame_{index:03d}.jpg")
+
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            # Pemanasan: import matplotlib & baca halaman mmap sebelum diukur
+            write_frame(0, render_job(renderer, voxel_data, centroid, jobs[0]))
+
+            render_time = encode_time = 0.0
+            t0 = time.perf_counter()
+            for job, pixel, stats in render_frames(jobs, voxel_data, centroid, canvas):
+                render_time += sum(stats.get(s, 0.0) for s in ("extract", "cull", "transform", "projection", "raster"))
+                t1 = time.perf_counter()
+                write_frame(job["index"], pixel)
+                encode_time += time.perf_counter() - t1
+            sync_time = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            with FrameWriter(write_frame, max_pending=args.max_pending) as writer:
+                for job, pixel, stats in render_frames(jobs, voxel_data, centroid, canvas):
+                    writer.write(job["index"], pixel)
+            async_time = time.perf_counter() - t0
+        finally:
+            os.chdir(previous)
+
+    print(f"  render total  : {render_time:7.2f}s")
+    print(f"  encode total  : {encode_time:7.2f}s")
+    print(f"  synchronous   : {sync_time:7.2f}s")
+    print(f"  FrameWriter   : {async_time:7.2f}s  (ideal ~{max(render_time, encode_time):.2f}s)"
+          f"  speedup {sync_time / async_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
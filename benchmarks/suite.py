@@ -0,0 +1,258 @@
+"""
+Benchmark suite - build model, cache load, render, encode dan preview Visualizer
+
+Semua kasus memakai konfigurasi dan seed tetap sehingga hasil antar run
+bisa dibandingkan. Visualizer dijalankan headless (backend Agg).
+Hasil ditulis ke result/benchmark.json dan result/benchmark.csv.
+
+Jalankan dari root project:
+    python benchmarks/suite.py                      # jalankan semua kasus
+    python benchmarks/suite.py --only render        # filter nama kasus
+    python benchmarks/suite.py --save-baseline      # simpan sebagai baseline
+    python benchmarks/suite.py --compare            # bandingkan dengan baseline,
+                                                    # exit 1 jika ada yang lebih lambat
+
+Baseline bergantung pada mesin sehingga tidak di-commit: jalankan
+--save-baseline sekali di mesin yang sama (mis. di commit acuan) sebelum
+--compare. Render memakai model solid ("voxels") seperti render default;
+render_surface_* mengukur kulit model (opsi surface_only) sebagai tambahan.
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ["MPLBACKEND"] = "Agg"
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rocket_model import RocketModel, load_or_build
+from frame_renderer import make_renderer, render_job
+
+SEED = 1234
+MODEL_SIZE = {"col": 320, "row": 450, "length": 320}
+CANVAS_SIZES = [(640, 480), (1280, 720), (1920, 1080)]
+POSE_COUNT = 4
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+FIELDS = ["name", "repeat", "min", "median", "mean"]
+PREVIEW_CASES = ("preview_camera_setup", "preview_translation", "preview_camera_path")
+
+
+def make_poses(count, seed=SEED):
+    """Pose objek & kamera acak tapi deterministik (seed tetap)"""
+    rng = np.random.default_rng(seed)
+    poses = []
+    for i in range(count):
+        poses.append({
+            "index": i,
+            "translation": rng.uniform(-20, 20, 3).round(2).tolist(),
+            "rotation": {"pitch": round(float(rng.uniform(-30, 30)), 2),
+                         "yaw": round(float(rng.uniform(0, 360)), 2)},
+            "cam_trans": [0.0, 0.0, round(float(rng.uniform(-400, -250)), 2)],
+            "cam_rot": {"pitch": 0.0, "yaw": 0.0}
+        })
+    return poses
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    """Jalankan blok di directory lain (save_image menulis ke ./result)"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def time_case(name, func, repeat, warmup=1):
+    """Jalankan func (warmup + repeat kali) dan kembalikan ringkasan waktu"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - t0)
+    result = {
+        "name": name,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples)
+    }
+    print(f"  {name:<28} median {result['median'] * 1000:9.1f} ms   min {result['min'] * 1000:9.1f} ms")
+    return result
+
+
+def ensure_cache():
+    return load_or_build(**MODEL_SIZE)[0]
+
+
+def model_cases(repeat):
+    """RocketModel.build dan load cache memory-mapped"""
+    yield "build", lambda: RocketModel(**MODEL_SIZE).build(), max(1, repeat // 3), 0
+    yield "cache_load", lambda: RocketModel.load_cache(**MODEL_SIZE), repeat, 1
+
+
+def render_cases(cache_data, repeat):
+    """Renderer.render untuk setiap ukuran canvas (model solid), plus kulit model di canvas terkecil"""
+    poses = make_poses(POSE_COUNT)
+    sizes = [("render", "voxels", size) for size in CANVAS_SIZES]
+    sizes.append(("render_surface", "surface", CANVAS_SIZES[0]))
+    for prefix, model, (width, height) in sizes:
+        renderer = make_renderer({"width": width, "height": height, "fov": 50})
+
+        def render_all(renderer=renderer, voxel_data=cache_data[model]):
+            for pose in poses:
+                render_job(renderer, voxel_data, cache_data["centroid"], pose)
+
+        yield f"{prefix}_{width}x{height}", render_all, repeat, 1
+
+
+def encode_cases(cache_data, repeat, workdir):
+    """Renderer.save_image (JPEG) untuk frame hasil render"""
+    pose = make_poses(1)[0]
+    for width, height in CANVAS_SIZES:
+        renderer = make_renderer({"width": width, "height": height, "fov": 50})
+        pixel = render_job(renderer, cache_data["voxels"], cache_data["centroid"], pose)
+
+        def encode(renderer=renderer, pixel=pixel):
+            with working_directory(workdir):
+                renderer.save_image(pixel, "bench_frame.jpg")
+
+        yield f"save_image_{width}x{height}", encode, repeat, 1
+
+
+def preview_cases(repeat):
+    """Metode preview Visualizer, digambar penuh di canvas Agg"""
+    from visualizer import Visualizer
+
+    visualizer = Visualizer()
+    poses = make_poses(POSE_COUNT)
+    points = [pose["translation"] for pose in poses]
+    rotations = [{"x": pose["rotation"]["pitch"], "y": pose["rotation"]["yaw"]} for pose in poses]
+    camera_points = [[0.0, 0.0, pose["cam_trans"][2]] for pose in poses]
+
+    def draw(show):
+        def run():
+            show()
+            visualizer.fig.canvas.draw()
+        return run
+
+    shows = [
+        lambda: visualizer.show_camera_setup_realtime(points[0], rotations[0]),
+        lambda: visualizer.show_translation_with_rocket(points, points[-1], rotations),
+        lambda: visualizer.show_camera_translation_path(camera_points, camera_points[-1])
+    ]
+    for name, show in zip(PREVIEW_CASES, shows):
+        yield name, draw(show), repeat, 1
+    visualizer.close()
+
+
+def run_suite(only, repeat):
+    def wanted(name):
+        return not only or any(key in name for key in only)
+
+    cache_data = ensure_cache()
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        groups = [model_cases(repeat), render_cases(cache_data, repeat),
+                  encode_cases(cache_data, repeat, workdir)]
+        # Visualizer memakai cache model yang sama (load_or_build); hanya dibuat jika kasus preview diminta
+        if any(wanted(name) for name in PREVIEW_CASES):
+            groups.append(preview_cases(repeat))
+        for group in groups:
+            for name, func, case_repeat, warmup in group:
+                if not wanted(name):
+                    continue
+                results.append(time_case(name, func, case_repeat, warmup))
+    return results
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": SEED,
+        "model": MODEL_SIZE,
+        "poses": POSE_COUNT
+    }
+
+
+def write_results(results, output):
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output + ".json", "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+    with open(output + ".csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"\nResults: {output}.json, {output}.csv")
+
+
+def compare(results, baseline_path, tolerance):
+    """Bandingkan median dengan baseline; return jumlah kasus yang regresi"""
+    with open(baseline_path) as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"]}
+
+    print(f"\nCompared with {baseline_path} (tolerance {tolerance:.0%}):")
+    regressions = 0
+    for result in results:
+        base = baseline.get(result["name"])
+        if base is None:
+            print(f"  {result['name']:<28} (no baseline)")
+            continue
+        ratio = result["median"] / base["median"]
+        slower = ratio > 1 + tolerance
+        regressions += slower
+        status = "SLOWER" if slower else "ok"
+        print(f"  {result['name']:<28} {base['median'] * 1000:9.1f} -> {result['median'] * 1000:9.1f} ms  "
+              f"{ratio:5.2f}x  {status}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite untuk hot path renderer")
+    parser.add_argument("--only", nargs="+", help="Hanya kasus yang namanya mengandung salah satu kata ini")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=os.path.join(ROOT, "result", "benchmark"),
+                        help="Prefix file hasil (.json dan .csv)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE,
+                        help="Simpan hasil sebagai baseline (default benchmarks/baseline.json)")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE,
+                        help="Bandingkan dengan baseline; exit 1 jika ada kasus lebih lambat")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Batas perlambatan relatif sebelum dianggap regresi (default 0.15)")
+    args = parser.parse_args()
+    if args.compare and not os.path.exists(args.compare):
+        parser.error(f"baseline {args.compare} not found; create it first with --save-baseline "
+                     f"(on the reference commit, same machine)")
+
+    with working_directory(ROOT):
+        print(f"Benchmark suite (seed {SEED}, repeat {args.repeat}, {os.cpu_count()} CPU(s))")
+        results = run_suite(args.only, args.repeat)
+
+    write_results(results, args.output)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+        print(f"Baseline saved: {args.save_baseline}")
+    if args.compare:
+        if compare(results, args.compare, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
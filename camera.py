@@ -93,3 +93,27 @@ class Camera:
         cam_z = dx * self.forward[0] + dy * self.forward[1] + dz * self.forward[2]
         
         return cam_x, cam_y, cam_z
+    
+    def get_view_matrix(self):
+        """
+        Matriks view affine 4x4 (world → camera), baris rotasi = right, up, forward
+        """
+        rotation = np.array([self.right, self.up, self.forward], dtype=float)
+        matrix = np.eye(4)
+        matrix[:3, :3] = rotation
+        matrix[:3, 3] = -rotation @ self.position
+        return matrix
+    
+    def world_to_camera_many(self, points):
+        """
+        Versi batch dari world_to_camera
+        
+        Args:
+            points: array (N, 3) koordinat world
+        
+        Returns:
+            array (N, 3) koordinat kamera (cam_x, cam_y, cam_z)
+        """
+        matrix = self.get_view_matrix()
+        points = np.asarray(points, dtype=float)
+        return points @ matrix[:3, :3].T + matrix[:3, 3]
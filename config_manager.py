@@ -1,7 +1,7 @@
 #ini file config_mnanager.py
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class ConfigManager:
     """Manages configuration for rocket animation with detailed tracking"""
@@ -37,11 +37,24 @@ class ConfigManager:
                 "width": 640,
                 "height": 480,
                 "fov": 50,
-                "description": "Render canvas dimensions and field of view"
+                "lod": 0.0,
+                "occlusion": True,
+                "threads": 1,
+                "description": "Render canvas dimensions and field of view; lod = max projected size (pixels) of a coarse LOD voxel (0 = always full detail, default; e.g. 1.0 = faster but coarser); occlusion = skip voxel bricks hidden behind already drawn ones (same image, less overdraw); threads = rasterizer threads per frame (screen tiles resolved in parallel, same image)"
             },
             "render": {
                 "total_frames": 1,
-                "description": "Number of frames to render"
+                "surface_only": False,
+                "interpolation": "linear",
+                "engine": "vectorized",
+                "animation": None,
+                "fps": 12,
+                "composite": {
+                    "frames": 4,
+                    "columns": None,
+                    "downsample": 1
+                },
+                "description": "Number of frames to render; surface_only renders only the voxel shell (faster but approximate: interior voxels seen through splat gaps are missing; false = full solid set, exact); interpolation between keyframes: linear or smooth (Catmull-Rom); engine: vectorized (fast) or reference (slow per-voxel loop, for correctness checks); animation: null, gif, apng or raw (single animation file streamed at fps); composite: evenly spaced frames tiled into rocket_display.png"
             }
         }
     
@@ -111,15 +124,35 @@ class ConfigManager:
         """Get all camera animation points"""
         return self.config["camera"]["animation_points"]
     
-    def set_render_settings(self, total_frames: int = 1):
-        """Set render settings"""
+    def set_render_settings(self, total_frames: int = 1, surface_only: Optional[bool] = None,
+                            interpolation: Optional[str] = None, engine: Optional[str] = None):
+        """Set render settings (surface_only/interpolation/engine=None keeps the current value)"""
         self.config["render"]["total_frames"] = max(1, int(total_frames))
-    
-    def set_canvas_settings(self, width: int = 640, height: int = 480, fov: int = 50):
-        """Set canvas settings"""
+        if surface_only is not None:
+            self.config["render"]["surface_only"] = bool(surface_only)
+        if interpolation is not None:
+            if interpolation not in ("linear", "smooth"):
+                raise ValueError(f"Unknown interpolation mode: {interpolation}")
+            self.config["render"]["interpolation"] = interpolation
+        if engine is not None:
+            from render_engine import ENGINES
+            if engine not in ENGINES:
+                raise ValueError(f"Unknown render engine: {engine}")
+            self.config["render"]["engine"] = engine
+    
+    def set_canvas_settings(self, width: int = 640, height: int = 480, fov: int = 50,
+                            lod: Optional[float] = None, occlusion: Optional[bool] = None,
+                            threads: Optional[int] = None):
+        """Set canvas settings (lod/occlusion/threads=None keeps the current value)"""
         self.config["canvas"]["width"] = int(width)
         self.config["canvas"]["height"] = int(height)
         self.config["canvas"]["fov"] = int(fov)
+        if lod is not None:
+            self.config["canvas"]["lod"] = max(0.0, float(lod))
+        if occlusion is not None:
+            self.config["canvas"]["occlusion"] = bool(occlusion)
+        if threads is not None:
+            self.config["canvas"]["threads"] = max(1, int(threads))
     
     def save(self):
         """Save configuration to file"""
@@ -0,0 +1,90 @@
+#ini file contact_sheet.py
+"""
+ContactSheet - Susun banyak frame menjadi satu gambar grid (NumPy murni)
+Label ringan digambar dengan font bitmap bawaan Pillow, tanpa pyplot
+"""
+import math
+
+import numpy as np
+
+
+LABEL_HEIGHT = 14
+
+
+def downsample(image, factor):
+    """Perkecil image (H, W, 3) dengan rata-rata blok factor x factor"""
+    factor = int(factor)
+    if factor <= 1:
+        return image
+    height = image.shape[0] // factor * factor
+    width = image.shape[1] // factor * factor
+    blocks = image[:height, :width].reshape(height // factor, factor, width // factor, factor, -1)
+    return blocks.mean(axis=(1, 3)).round().astype(np.uint8)
+
+
+def pick_frames(total, count):
+    """Index frame yang tersebar rata di seluruh animasi (termasuk frame pertama & terakhir)"""
+    if total <= 0 or count <= 0:
+        return []
+    if count >= total:
+        return list(range(total))
+    return sorted(set(np.linspace(0, total - 1, count).round().astype(int).tolist()))
+
+
+def build_contact_sheet(images, labels=None, columns=None, padding=4, background=(255, 255, 255)):
+    """
+    Susun images ke grid dan return satu array (H, W, 3) uint8
+
+    Args:
+        images: list array (h, w, 3); ukuran boleh berbeda (sel = ukuran terbesar)
+        labels: list teks per image (opsional), digambar di atas setiap sel
+        columns: jumlah kolom; default mendekati persegi
+        padding: jarak antar sel (pixel)
+        background: warna latar RGB
+    """
+    if len(images) == 0:
+        raise ValueError("At least one image is required")
+    columns = max(1, min(columns or math.ceil(math.sqrt(len(images))), len(images)))
+    rows = math.ceil(len(images) / columns)
+
+    cell_h = max(img.shape[0] for img in images)
+    cell_w = max(img.shape[1] for img in images)
+    label_h = LABEL_HEIGHT if labels else 0
+    step_y = cell_h + label_h + padding
+    step_x = cell_w + padding
+
+    sheet = np.empty((rows * step_y + padding, columns * step_x + padding, 3), dtype=np.uint8)
+    sheet[:] = background
+    origins = []
+    for n, img in enumerate(images):
+        y = padding + (n // columns) * step_y
+        x = padding + (n % columns) * step_x
+        sheet[y + label_h:y + label_h + img.shape[0], x:x + img.shape[1]] = img[..., :3]
+        origins.append((x, y))
+
+    if labels:
+        _draw_labels(sheet, labels, origins)
+    return sheet
+
+
+def _draw_labels(sheet, labels, origins):
+    """Gambar label teks (font bitmap default Pillow) langsung ke array sheet"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    canvas = Image.fromarray(sheet)
+    draw = ImageDraw.Draw(canvas)
+    font = ImageFont.load_default()
+    for label, (x, y) in zip(labels, origins):
+        if label:
+            draw.text((x + 1, y + 1), str(label), fill=(0, 0, 0), font=font)
+    sheet[:] = np.asarray(canvas)
+
+
+def save_contact_sheet(images, filepath, labels=None, columns=None, factor=1):
+    """Downsample, susun dan simpan contact sheet ke filepath (format dari ekstensi)"""
+    from PIL import Image
+
+    thumbnails = [downsample(img, factor) for img in images]
+    sheet = build_contact_sheet(thumbnails, labels, columns)
+    Image.fromarray(sheet).save(filepath)
+    return filepath
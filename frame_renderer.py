@@ -0,0 +1,143 @@
+#ini file frame_renderer.py
+"""
+FrameRenderer - Render banyak frame animasi, serial atau paralel (process pool)
+Voxel dibagi ke worker lewat cache model memory-mapped (tidak di-pickle per worker)
+"""
+import multiprocessing as mp
+from collections import deque
+
+from rocket_model import RocketModel
+from transform import Transform
+from camera import Camera
+from render_engine import DEFAULT_ENGINE, engine_class
+from render_report import peak_rss_mb
+
+
+def make_camera(cam_trans, cam_rot, centroid):
+    """Buat Camera untuk satu frame (posisi relatif terhadap centroid, melihat ke centroid)"""
+    centroid_x, centroid_y, centroid_z = centroid
+    cam_position = (cam_trans[0] + centroid_x, cam_trans[1] + centroid_y, cam_trans[2] + centroid_z)
+    cam_target = (centroid_x, centroid_y, centroid_z)
+    return Camera(cam_position, cam_target, {
+        "x": cam_rot.get("pitch", 0),
+        "y": cam_rot.get("yaw", 0),
+        "z": 0
+    })
+
+
+def make_transform(translation, rotation):
+    """Buat Transform objek untuk satu frame"""
+    transform = Transform()
+    transform.set_rotation_degrees(
+        yaw=rotation.get('yaw', 0.0),
+        pitch=rotation.get('pitch', 0.0),
+        roll=0
+    )
+    transform.set_translation(tx=translation[0], ty=translation[1], tz=translation[2])
+    return transform
+
+
+def make_renderer(canvas_settings, engine=DEFAULT_ENGINE):
+    """Buat Renderer engine terdaftar (render.engine) dari canvas settings config"""
+    return engine_class(engine)(
+        width=canvas_settings.get("width", 640),
+        height=canvas_settings.get("height", 480),
+        fov=canvas_settings.get("fov", 50),
+        threshold=10,
+        lod=canvas_settings.get("lod", 0.0),
+        occlusion=canvas_settings.get("occlusion", False),
+        threads=canvas_settings.get("threads", 1)
+    )
+
+
+def render_job(renderer, voxel_data, centroid, job, stats=None):
+    """Render satu frame job (dict dengan translation, rotation, cam_trans, cam_rot)"""
+    camera = make_camera(job["cam_trans"], job["cam_rot"], centroid)
+    transform = make_transform(job["translation"], job["rotation"])
+    return renderer.render(voxel_data, camera, transform, centroid, stats=stats)
+
+
+def _render_with_stats(renderer, voxel_data, centroid, job):
+    """Render satu frame job, return (pixel, stats) dengan peak memori proses perender"""
+    stats = {}
+    pixel = render_job(renderer, voxel_data, centroid, job, stats)
+    stats["peak_rss_mb"] = peak_rss_mb()
+    return pixel, stats
+
+
+# State per proses worker (diisi oleh _init_worker)
+_worker = {}
+
+
+def _init_worker(canvas_settings, surface_only, engine):
+    """Initializer worker: buka cache model memory-mapped sekali per proses"""
+    cache_data = RocketModel.load_cache()
+    if cache_data is None:
+        raise RuntimeError("Model cache not found; build the model before starting workers")
+    _worker["voxel_data"] = cache_data["surface"] if surface_only else cache_data["voxels"]
+    _worker["centroid"] = cache_data["centroid"]
+    # Thread pool rasterizer ikut berhenti saat proses worker diakhiri pool
+    _worker["renderer"] = make_renderer(canvas_settings, engine)
+
+
+def _render_in_worker(job):
+    return _render_with_stats(_worker["renderer"], _worker["voxel_data"], _worker["centroid"], job)
+
+
+def render_frames(jobs, voxel_data, centroid, canvas_settings, workers=1, surface_only=False, max_in_flight=None,
+                  engine=DEFAULT_ENGINE):
+    """
+    Render semua frame job, hasil di-yield berurutan sesuai index frame
+
+    Dengan process pool, paling banyak max_in_flight frame (default 2 x workers)
+    dirender atau menunggu diambil sekaligus, sehingga memori tetap konstan
+    walaupun konsumen (encode/tulis) lebih lambat dari worker.
+
+    Process pool langsung dibuat (worker di-fork) saat fungsi ini dipanggil,
+    bukan saat iterasi pertama: panggil sebelum menjalankan thread lain
+    (mis. FrameWriter), karena fork dari proses yang punya thread aktif bisa
+    deadlock. Pool ditutup saat iterasi selesai.
+
+    Args:
+        jobs: list frame job
+        voxel_data: VoxelSet (dipakai untuk render serial)
+        centroid: (cx, cy, cz)
+        canvas_settings: dict width/height/fov
+        workers: jumlah proses; > 1 memakai process pool
+        surface_only: pilih kulit model atau solid penuh di worker
+        max_in_flight: batas frame yang sedang dirender / belum diambil
+        engine: nama engine render terdaftar (lihat render_engine.ENGINES)
+
+    Returns:
+        iterator (job, pixel, stats) - stats berisi timing stage & jumlah voxel dari engine.render
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return _render_serial(jobs, voxel_data, centroid, canvas_settings, engine)
+
+    workers = min(workers, len(jobs))
+    pool = mp.Pool(workers, initializer=_init_worker, initargs=(canvas_settings, surface_only, engine))
+    return _render_pooled(pool, jobs, max(1, max_in_flight or 2 * workers))
+
+
+def _render_serial(jobs, voxel_data, centroid, canvas_settings, engine):
+    with make_renderer(canvas_settings, engine) as renderer:
+        for job in jobs:
+            yield (job,) + _render_with_stats(renderer, voxel_data, centroid, job)
+
+
+def _render_pooled(pool, jobs, max_in_flight):
+    with pool:
+        # Antrian FIFO menjaga urutan frame; worker lain tetap jalan sementara frame ini ditulis
+        pending_jobs = iter(jobs)
+        in_flight = deque()
+        for job in pending_jobs:
+            in_flight.append((job, pool.apply_async(_render_in_worker, (job,))))
+            if len(in_flight) >= max_in_flight:
+                break
+        while in_flight:
+            job, result = in_flight.popleft()
+            pixel, stats = result.get()
+            next_job = next(pending_jobs, None)
+            if next_job is not None:
+                in_flight.append((next_job, pool.apply_async(_render_in_worker, (next_job,))))
+            yield job, pixel, stats
@@ -0,0 +1,91 @@
+#ini file frame_writer.py
+"""
+FrameWriter - Encode & simpan frame di background thread
+Frame berikutnya dirender sementara frame sebelumnya di-encode ke disk
+"""
+import queue
+import threading
+import time
+
+
+class FrameWriter:
+    """
+    Stage penulis frame dengan antrian terbatas (bounded queue)
+
+    write() memblokir saat antrian penuh (back-pressure), sehingga memori
+    paling banyak menahan max_pending frame. Error di thread penulis
+    dilempar ulang di write()/close() berikutnya. close() menunggu semua
+    frame selesai ditulis (flush).
+
+    Contoh:
+        with FrameWriter(lambda i, pixel: renderer.save_image(pixel, f"{i}.jpg")) as writer:
+            for i, pixel in enumerate(frames):
+                writer.write(i, pixel)
+    """
+
+    _STOP = object()
+
+    def __init__(self, write_frame, max_pending=4, on_written=None):
+        """
+        Args:
+            write_frame: fungsi (index, pixel) -> hasil, dijalankan di thread penulis
+            max_pending: jumlah maksimum frame yang menunggu ditulis
+            on_written: callback opsional (index, hasil, detik) setelah frame ditulis
+        """
+        self.write_frame = write_frame
+        self.on_written = on_written
+        self.written = 0
+        self._queue = queue.Queue(maxsize=max(1, max_pending))
+        self._error = None
+        self._abort = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="FrameWriter", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            # Setelah error/abort sisa antrian dibuang agar producer tidak macet
+            if self._error is not None or self._abort:
+                continue
+            index, pixel = item
+            try:
+                start = time.perf_counter()
+                result = self.write_frame(index, pixel)
+                elapsed = time.perf_counter() - start
+                self.written += 1
+                if self.on_written is not None:
+                    self.on_written(index, result, elapsed)
+            except BaseException as e:
+                self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"Frame writer failed: {self._error}") from self._error
+
+    def write(self, index, pixel):
+        """Antrikan satu frame; blok jika antrian penuh"""
+        if self._closed:
+            raise RuntimeError("FrameWriter is closed")
+        self._raise_error()
+        self._queue.put((index, pixel))
+
+    def close(self, abort=False):
+        """Flush (atau buang jika abort) frame tersisa, tunggu thread selesai, lempar error jika ada"""
+        if not self._closed:
+            self._closed = True
+            self._abort = abort
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if not abort:
+            self._raise_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Jika loop render gagal, jangan tunggu encode frame sisa dan jangan tutupi error aslinya
+        self.close(abort=exc_type is not None)
+        return False
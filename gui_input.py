@@ -1,5 +1,6 @@
 #ini file gui_input.py
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -8,14 +9,24 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QH
                             QLabel, QPushButton, QTabWidget, QScrollArea, QFrame, QListWidget, 
                             QListWidgetItem, QGridLayout, QMessageBox, QFileDialog, QLineEdit,
                             QDoubleSpinBox, QSpinBox, QGroupBox, QDialog, QDialogButtonBox)
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QObject, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QDoubleValidator
 from typing import Optional
 from config_manager import ConfigManager
 from visualizer import Visualizer
 
+
+class _FutureBridge(QObject):
+    """Teruskan future yang selesai di thread worker ke main thread Qt (signal antar thread = queued)"""
+    done = pyqtSignal(object)
+
+
 class GUIInput:
     """GUI untuk input konfigurasi - layout yang lebih baik dan lega"""
+    
+    # Jeda (ms) tanpa edit sebelum preview fast diganti preview full detail
+    preview_settle_ms = 400
+    
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.window = QMainWindow()
@@ -24,7 +35,22 @@ class GUIInput:
         self.window.setMinimumSize(1000, 700)
         
         self.config = ConfigManager()
-        self.visualizer = Visualizer()
+        # Model di-load di thread worker; sampai selesai preview menampilkan placeholder
+        self.visualizer = Visualizer(load=False)
+        self._worker = ThreadPoolExecutor(max_workers=1)
+        self._model_bridge = _FutureBridge()
+        self._model_bridge.done.connect(self._on_model_loaded)
+        # Preview dihitung di worker yang sama: paling banyak satu job berjalan,
+        # permintaan berikutnya hanya disimpan (yang terbaru menang)
+        self._preview_bridge = _FutureBridge()
+        self._preview_bridge.done.connect(self._on_preview_ready)
+        self._preview_future = None
+        self._preview_pending = None
+        # Setelah edit berhenti, preview dihitung ulang dengan semua voxel (quality="full")
+        self._refine_timer = QTimer()
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.setInterval(self.preview_settle_ms)
+        self._refine_timer.timeout.connect(self._request_full_preview)
         
         # Configuration data
         self.camera_position = [0.0, 0.0, -150.0]
@@ -38,11 +64,89 @@ class GUIInput:
         self.current_tab = "camera"
         self.selected_point_idx = None
         
-        # Show matplotlib awal
-        self.visualizer.show_camera_setup_realtime([0, 0, 0], {"x": 0, "y": 0})
+        self.setup_ui()
+        
+        # Window konfigurasi langsung bisa dipakai: load model di background,
+        # figure matplotlib (placeholder) dibuat setelah event loop berjalan
+        future = self._worker.submit(self.visualizer.load_model)
+        future.add_done_callback(self._model_bridge.done.emit)
+        QTimer.singleShot(0, self._show_first_preview)
+        
+    def _show_first_preview(self):
+        """Tampilkan figure matplotlib awal (placeholder jika model belum siap)"""
+        self.show_preview()
         plt.show(block=False)
         
-        self.setup_ui()
+    def _on_model_loaded(self, future):
+        """Dipanggil di main thread setelah load model di worker selesai"""
+        error = future.exception()
+        if error is not None:
+            self.status.setText(f"Status: Failed to load rocket model: {error}")
+            return
+        self.status.setText("Status: Rocket model loaded")
+        self.request_preview()
+        
+    def show_preview(self):
+        """Gambar ulang preview camera setup dengan posisi/rotasi kamera saat ini (sinkron)"""
+        self.visualizer.set_camera_position(self.camera_position[0], self.camera_position[1], self.camera_position[2])
+        self.visualizer.set_camera_rotation(self.camera_rotation["x"], self.camera_rotation["y"])
+        self.visualizer.show_camera_setup_realtime([0, 0, 0], self.camera_rotation)
+        
+    def request_preview(self, quality="fast"):
+        """
+        Minta preview camera setup baru dihitung di worker (latest wins)
+        
+        Jika job sebelumnya masih berjalan, permintaan ini hanya menggantikan
+        permintaan tertunda; permintaan lama yang belum dikirim dibuang.
+        Generation visualizer dicatat sekarang: jika setelah ini ada show_*
+        sinkron (mis. Apply), hasil worker dibuang saat selesai.
+        """
+        if not self.visualizer.ready:
+            # Placeholder tetap tampil; _on_model_loaded meminta preview lagi
+            return
+        if quality == "fast":
+            # Edit baru: refinement full detail ditunda sampai edit berhenti lagi
+            self._refine_timer.stop()
+        self._preview_pending = (list(self.camera_position), dict(self.camera_rotation),
+                                 self.visualizer.generation, quality)
+        if self._preview_future is None:
+            self._submit_preview()
+            
+    def _request_full_preview(self):
+        """Timer settle habis: hitung ulang preview terakhir dengan semua voxel"""
+        if self._preview_future is None and self._preview_pending is None:
+            self.request_preview(quality="full")
+            
+    def _submit_preview(self):
+        camera_position, camera_rotation, generation, quality = self._preview_pending
+        self._preview_pending = None
+        if generation != self.visualizer.generation:
+            # Sudah digantikan show_* sinkron; tidak perlu dihitung
+            return
+        self._preview_future = self._worker.submit(
+            self.visualizer.prepare_camera_setup, [0, 0, 0], camera_rotation, camera_position, camera_rotation,
+            generation, quality)
+        self._preview_future.add_done_callback(self._preview_bridge.done.emit)
+        
+    def _on_preview_ready(self, future):
+        """Main thread: tampilkan hasil preview, kecuali sudah ada permintaan yang lebih baru"""
+        self._preview_future = None
+        if self._preview_pending is not None:
+            # Hasil ini sudah usang: hitung permintaan terbaru, jangan digambar
+            self._submit_preview()
+            return
+        error = future.exception()
+        if error is not None:
+            self.status.setText(f"Status: Preview failed: {error}")
+            return
+        preview = future.result()
+        if not self.visualizer.present_camera_setup(preview):
+            return
+        if preview["quality"] == "fast":
+            self.status.setText("Status: Visualization updated")
+            self._refine_timer.start()
+        else:
+            self.status.setText("Status: Visualization updated (full detail)")
         
     def setup_ui(self):
         """Setup main UI"""
@@ -254,6 +358,10 @@ class GUIInput:
         update_btn.clicked.connect(self.update_vis)
         rot_layout_inner.addWidget(update_btn)
         
+        # Preview mengikuti spinbox saat nilainya diubah (dihitung di worker, latest wins)
+        for spinbox in (self.cam_x, self.cam_y, self.cam_z, self.cam_pitch, self.cam_yaw):
+            spinbox.valueChanged.connect(self.update_vis)
+        
         rot_layout.addWidget(rot_row)
         scroll_layout.addWidget(rot_group)
         
@@ -422,7 +530,7 @@ class GUIInput:
         frame_row_layout.addWidget(QLabel("Total Frames:"))
         
         self.frame_var = QSpinBox()
-        self.frame_var.setRange(1, 100)
+        self.frame_var.setRange(1, 1000)
         self.frame_var.setValue(1)
         self.frame_var.setFixedWidth(100)
         frame_row_layout.addWidget(self.frame_var)
@@ -578,15 +686,8 @@ class GUIInput:
             self.camera_position = [self.cam_x.value(), self.cam_y.value(), self.cam_z.value()]
             self.camera_rotation = {"x": self.cam_pitch.value(), "y": self.cam_yaw.value()}
             
-            # Update visualizer
-            self.visualizer.set_camera_position(self.camera_position[0], self.camera_position[1], self.camera_position[2])
-            self.visualizer.set_camera_rotation(self.camera_rotation["x"], self.camera_rotation["y"])
-            
-            # Update view
-            self.visualizer.show_camera_setup_realtime([0, 0, 0], self.camera_rotation)
-            plt.draw()
-            
-            self.status.setText("Status: Visualization updated")
+            # Proyeksi dihitung di worker; main thread hanya menggambar hasil terakhir
+            self.request_preview()
         except Exception as e:
             QMessageBox.critical(self.window, "Error", f"Update failed: {e}")
             
@@ -773,7 +874,6 @@ class GUIInput:
             else:
                 self.update_vis()
                 
-            plt.draw()
             QMessageBox.information(self.window, "Success", "Configuration saved!\nClick 'Render Now' when ready to render.")
         except Exception as e:
             QMessageBox.critical(self.window, "Error", f"Failed to save: {e}")
@@ -798,5 +898,7 @@ class GUIInput:
             
     def run(self) -> Optional[ConfigManager]:
         """Run GUI"""
-        sys.exit(self.app.exec())
+        code = self.app.exec()
+        self._worker.shutdown(wait=False, cancel_futures=True)
+        sys.exit(code)
         return self.result
\ No newline at end of file
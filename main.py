@@ -3,37 +3,53 @@
 Main - Entry point untuk render rocket dengan input interaktif
 Real-time visualization dengan rocket model asli
 """
-print("\033c")
+import contextlib
+import json
 import os
+import time
 import numpy as np
-from gui_input import GUIInput
 from config_manager import ConfigManager
-from rocket_model import RocketModel
-from transform import Transform
-from camera import Camera
-from renderer import Renderer
+from rocket_model import load_or_build
+from frame_renderer import make_renderer, render_frames, render_job
+from timeline import build_jobs
+from render_report import RenderReport
+from frame_writer import FrameWriter
+from animation_writer import ANIMATION_FORMATS, open_animation
+from contact_sheet import downsample, pick_frames
+from render_engine import DEFAULT_ENGINE, ENGINES, compare_images
 
 
-def render_with_config(config: ConfigManager):
-    """Render rocket using configuration"""
+def render_with_config(config: ConfigManager, workers: int = 1, animation: str = None, fps: int = None,
+                       threads: int = None, engine: str = None, cross_check: str = None):
+    """Render rocket using configuration
+    
+    Args:
+        config: ConfigManager yang sudah di-load
+        workers: jumlah proses render paralel (1 = serial)
+        threads: thread rasterizer per frame; None = pakai canvas.threads di config
+        engine: engine render (lihat render_engine.ENGINES); None = pakai render.engine di config
+        cross_check: engine pembanding; setiap frame juga dirender dengan engine ini
+            dan selisih pixel-nya dilaporkan (None = tanpa cross-check)
+        animation: format animasi (gif, apng, raw); None = pakai render.animation di config
+        fps: frame rate animasi; None = pakai render.fps di config
+    """
     print("\n" + "=" * 60)
     print("RENDERING ROCKET")
     print("=" * 60)
     
     print("\n[1] Loading/Building Rocket Model...")
     # Try load from cache first
-    cache_data = RocketModel.load_cache()
-    if cache_data:
-        voxel_data = cache_data["voxel"]
-        centroid = cache_data["centroid"]
-    else:
-        # Build and cache
-        rocket = RocketModel(col=320, row=450, length=320)
-        voxel_data = rocket.build()
-        centroid = rocket.get_centroid()
-        rocket.save_cache()
+    render_settings = config.get_render_settings()
+    surface_only = render_settings.get("surface_only", False)
+    
+    t_model = time.perf_counter()
+    cache_data, model_source = load_or_build()
+    voxel_data = cache_data["surface"] if surface_only else cache_data["voxels"]
+    centroid = cache_data["centroid"]
+    t_model = time.perf_counter() - t_model
     
-    print(f"✓ Rocket ready! Centroid: {centroid}")
+    mode = "surface shell" if surface_only else "full solid"
+    print(f"✓ Rocket ready! Centroid: {centroid} ({len(voxel_data)} voxels, {mode})")
     
     print("\n[2] Setting up Camera...")
     camera_settings = config.get_camera_settings()
@@ -53,16 +69,17 @@ def render_with_config(config: ConfigManager):
     
     print("\n[3] Initializing Renderer...")
     canvas_settings = config.get_canvas_settings()
-    renderer = Renderer(
-        width=canvas_settings.get("width", 640),
-        height=canvas_settings.get("height", 480),
-        fov=canvas_settings.get("fov", 50),
-        threshold=10
-    )
-    print("✓ Renderer ready!")
+    if threads:
+        canvas_settings = dict(canvas_settings, threads=max(1, threads))
+    if cross_check and canvas_settings.get("lod", 0.0):
+        # Engine reference selalu full detail: kedua engine dibandingkan pada setting yang sama
+        print(f"  Cross-check: canvas.lod {canvas_settings['lod']} -> 0 (full detail)")
+        canvas_settings = dict(canvas_settings, lod=0.0)
+    engine = engine or render_settings.get("engine", DEFAULT_ENGINE)
+    print(f"✓ Renderer ready! ({engine} engine, {workers} worker(s), "
+          f"{canvas_settings.get('threads', 1)} raster thread(s))")
     
     animation_points = config.get_animation_points()
-    render_settings = config.get_render_settings()
     total_frames = render_settings.get("total_frames", 1)
     
     print("\n[4] Rendering frames...")
@@ -73,91 +90,191 @@ def render_with_config(config: ConfigManager):
             "rotation": {"pitch": 0, "yaw": 0}
         }]
     
-    rendered_images = []
-    
-    # Calculate total frames based on max of object points and camera points
+    # Jumlah frame mengikuti total_frames, minimal satu frame per keyframe
     max_points = max(len(animation_points), len(camera_animation_points))
+    frame_count = max(total_frames, max_points)
+    interpolation = render_settings.get("interpolation", "linear")
+    print(f"  {frame_count} frame(s), {interpolation} interpolation between keyframes")
     
-    for i in range(max_points):
-        # Get object animation point (cycle if needed)
-        obj_idx = i % len(animation_points)
-        point_data = animation_points[obj_idx]
-        translation = point_data["translation"]["position"]
-        rotation = point_data["rotation"]
-        rot_x = rotation.get('pitch', 0.0)
-        rot_y = rotation.get('yaw', 0.0)
-        
-        # Get camera animation point (cycle if needed)
-        cam_idx = i % len(camera_animation_points)
-        cam_point_data = camera_animation_points[cam_idx]
-        cam_trans = cam_point_data["translation"]["position"]
-        cam_rot = cam_point_data["rotation"]
-        
-        # Create camera for this frame
-        cam_position = (cam_trans[0] + rocket.cx, cam_trans[1] + rocket.cy, cam_trans[2] + rocket.cz)
-        cam_target = (rocket.cx, rocket.cy, rocket.cz)
-        camera = Camera(cam_position, cam_target, {
-            "x": cam_rot.get("pitch", 0),
-            "y": cam_rot.get("yaw", 0),
-            "z": 0
-        })
-        
-        print(f"\n  Frame {i+1}/{max_points}:")
-        print(f"    Object Position: ({translation[0]:.1f}, {translation[1]:.1f}, {translation[2]:.1f})")
-        print(f"    Object Rotation: Pitch={rot_x}°, Yaw={rot_y}°")
-        print(f"    Camera Position: ({cam_trans[0]:.1f}, {cam_trans[1]:.1f}, {cam_trans[2]:.1f})")
-        print(f"    Camera Rotation: Pitch={cam_rot.get('pitch', 0)}°, Yaw={cam_rot.get('yaw', 0)}°")
-        
-        transform = Transform()
-        transform.set_rotation_degrees(
-            yaw=rot_y,
-            pitch=rot_x,
-            roll=0
-        )
-        transform.set_translation(tx=translation[0], ty=translation[1], tz=translation[2])
-        
-        pixel = renderer.render(voxel_data, camera, transform, centroid)
-        rendered_images.append(pixel)
-        
-        output_file = f"rocket_frame_{i:03d}.jpg"
-        filepath = renderer.save_image(pixel, output_file)
-        print(f"    ✓ Saved: {filepath}")
+    jobs = build_jobs(animation_points, camera_animation_points, frame_count, interpolation)
+    
+    # Composite: frame tersebar rata, disimpan sebagai thumbnail; frame lain langsung dilepas setelah ditulis
+    composite_settings = render_settings.get("composite") or {}
+    composite_factor = composite_settings.get("downsample", 1)
+    composite_indices = set(pick_frames(frame_count, composite_settings.get("frames", 4)))
+    composite_images = {}
+    
+    report = RenderReport({
+        "canvas": {key: canvas_settings.get(key) for key in ("width", "height", "fov", "lod", "occlusion", "threads")},
+        "frames": frame_count,
+        "workers": workers,
+        "surface_only": surface_only,
+        "interpolation": interpolation,
+        "engine": engine,
+        "cross_check": cross_check
+    })
+    report.set_model(model_source, t_model, len(voxel_data))
+    
+    renderer = make_renderer(canvas_settings, engine)
+    # Cross-check: engine pembanding dirender di proses utama untuk setiap frame
+    checker = make_renderer(canvas_settings, cross_check) if cross_check else None
+    if checker:
+        print(f"  Cross-checking every frame against the {cross_check} engine")
+    
+    # Animasi opsional: frame di-stream ke satu file sambil JPEG per frame tetap ditulis
+    animation = animation or render_settings.get("animation")
+    fps = fps or render_settings.get("fps", 12)
+    animation_writer = open_animation(animation, fps=fps) if animation else None
+    if animation_writer:
+        print(f"  Streaming {animation} animation to {animation_writer.path} ({fps} fps)")
+    
+    def write_frame(index, pixel):
+        filepath = renderer.save_image(pixel, f"rocket_frame_{index:03d}.jpg")
+        if animation_writer:
+            animation_writer.write(pixel)
+        return filepath
+    
+    # Process pool (jika workers > 1) di-fork di sini, sebelum thread FrameWriter berjalan
+    frames = render_frames(jobs, voxel_data, centroid, canvas_settings,
+                           workers=workers, surface_only=surface_only, engine=engine)
+    # Encode JPEG berjalan di thread penulis sementara frame berikutnya dirender;
+    # FrameWriter di-flush dulu sebelum file animasi ditutup
+    on_written = lambda index, path, seconds: report.add_encode(index, seconds)
+    # Renderer cross-check (render di proses ini) ditutup bersama writer: thread pool rasterizer berhenti
+    with checker or contextlib.nullcontext(), animation_writer or contextlib.nullcontext(), \
+            FrameWriter(write_frame, on_written=on_written) as writer:
+        for job, pixel, stats in frames:
+            i = job["index"]
+            translation, rotation = job["translation"], job["rotation"]
+            cam_trans, cam_rot = job["cam_trans"], job["cam_rot"]
+            
+            print(f"\n  Frame {i+1}/{frame_count}:")
+            print(f"    Object Position: ({translation[0]:.1f}, {translation[1]:.1f}, {translation[2]:.1f})")
+            print(f"    Object Rotation: Pitch={rotation.get('pitch', 0.0):.1f}°, Yaw={rotation.get('yaw', 0.0):.1f}°")
+            print(f"    Camera Position: ({cam_trans[0]:.1f}, {cam_trans[1]:.1f}, {cam_trans[2]:.1f})")
+            print(f"    Camera Rotation: Pitch={cam_rot.get('pitch', 0):.1f}°, Yaw={cam_rot.get('yaw', 0):.1f}°")
+            if "drawn" in stats:
+                print(f"    Voxels (LOD {stats.get('lod', 1)}x): {stats['active']} active, {stats.get('culled', 0)} culled "
+                      f"({stats.get('bricks_culled', 0)}/{stats.get('bricks', 0)} bricks), "
+                      f"{stats['clipped']} clipped, {stats['drawn']} drawn")
+            else:
+                print(f"    Voxels: {stats.get('active', 0)} active ({engine} engine)")
+            if stats.get("pixels"):
+                print(f"    Overdraw: {stats['fragments'] / stats['pixels']:.2f} fragments/pixel "
+                      f"({stats.get('bricks_occluded', 0)} bricks, {stats.get('occluded', 0)} voxels occluded)")
+            
+            if i in composite_indices:
+                composite_images[i] = downsample(pixel, composite_factor)
+            
+            report.add_frame(i, stats)
+            if checker:
+                diff = compare_images(render_job(checker, voxel_data, centroid, job), pixel)
+                report.add_cross_check(i, diff)
+                print(f"    Cross-check vs {cross_check}: {diff['pixels']} pixel(s) differ "
+                      f"({diff['percent']:.2f}%, max diff {diff['max_diff']})")
+            writer.write(i, pixel)
+            print(f"    → Queued: result/rocket_frame_{i:03d}.jpg")
+    print(f"\n  ✓ {writer.written} frame(s) written to result/")
     
     print("\n[5] Creating final composite...")
-    if len(rendered_images) > 0:
-        titles = [f"Frame {i+1}" for i in range(len(rendered_images))]
-        renderer.display_images(rendered_images[:min(4, len(rendered_images))],
-                               titles[:min(4, len(rendered_images))])
+    if len(composite_images) > 0:
+        indices = sorted(composite_images)
+        renderer.display_images([composite_images[i] for i in indices],
+                                [f"Frame {i+1}" for i in indices],
+                                columns=composite_settings.get("columns"))
+    
+    report_path = report.save()
     
     print("\n" + "=" * 60)
     print("RENDER COMPLETE!")
     print("=" * 60)
     print(f"\nOutput saved in 'result/' folder:")
-    print(f"  - {len(rendered_images)} frame(s) rendered")
+    print(f"  - {writer.written} frame(s) rendered")
     print(f"  - Object animation points: {len(animation_points)}")
     print(f"  - Camera animation points: {len(camera_animation_points)}")
     print(f"  - Configuration: result/animation_config.json")
     print(f"  - Total frames configured: {total_frames}")
+    print(f"  - Timing report: {report_path}")
+    overdraw = report.overdraw()
+    if overdraw is not None:
+        occlusion = "on" if canvas_settings.get("occlusion") else "off"
+        print(f"  - Overdraw: {overdraw:.2f} fragments/pixel (occlusion culling {occlusion})")
+    if checker:
+        summary = report.cross_check_summary()
+        verdict = "identical" if summary["frames_differing"] == 0 else "DIFFERENT"
+        print(f"  - Cross-check {engine} vs {cross_check}: {verdict} "
+              f"({summary['frames_differing']}/{summary['frames']} frame(s) differ, "
+              f"max {summary['max_percent']:.2f}% pixels)")
+    if animation_writer:
+        print(f"  - Animation: {animation_writer.path} ({animation_writer.frames} frames)")
+        if isinstance(animation_writer, ANIMATION_FORMATS["raw"]):
+            print(f"    Encode with: {animation_writer.encoder_hint()}")
     print("=" * 60)
 
 
+def profile_render(config: ConfigManager, **options):
+    """Jalankan render_with_config di bawah cProfile dan simpan hasilnya di result/"""
+    import cProfile
+    import pstats
+    
+    profiler = cProfile.Profile()
+    profiler.runcall(render_with_config, config, **options)
+    
+    os.makedirs("result", exist_ok=True)
+    filepath = os.path.join("result", "render_profile.prof")
+    profiler.dump_stats(filepath)
+    print(f"\nProfile saved to: {filepath} (top 15 by cumulative time)")
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+
 def main():
-    import sys
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Rocket 3D Renderer")
+    parser.add_argument("mode", nargs="?", choices=["render"],
+                        help="'render' untuk render dari konfigurasi tersimpan tanpa GUI")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Jumlah proses render paralel (default: 1)")
+    parser.add_argument("--threads", type=int,
+                        help="Jumlah thread rasterizer per frame (override canvas.threads)")
+    parser.add_argument("--engine", choices=sorted(ENGINES),
+                        help="Engine render (override render.engine)")
+    parser.add_argument("--cross-check", choices=sorted(ENGINES), metavar="ENGINE",
+                        help="Render setiap frame juga dengan ENGINE dan laporkan selisih pixel "
+                             f"(pilihan: {', '.join(sorted(ENGINES))})")
+    parser.add_argument("--profile", action="store_true",
+                        help="Simpan profil cProfile ke result/render_profile.prof "
+                             "(hanya proses utama; pakai --workers 1 untuk profil render lengkap)")
+    parser.add_argument("--animation", choices=sorted(ANIMATION_FORMATS),
+                        help="Stream frame ke satu file animasi di result/ (override render.animation)")
+    parser.add_argument("--fps", type=int, help="Frame rate animasi (override render.fps)")
+    args = parser.parse_args()
+    
+    print("\033c")
     
     # Check if user passed 'render' argument to skip GUI
-    if len(sys.argv) > 1 and sys.argv[1] == 'render':
+    if args.mode == 'render':
         print("=" * 70)
         print(" " * 15 + "ROCKET 3D RENDERER - RENDER MODE")
         print("=" * 70)
         print("\nLoading saved configuration...")
         config = ConfigManager()
+        # Hanya kegagalan membaca config yang ditangkap; error saat render tetap dilempar
         try:
+            # load() diam-diam memakai default jika file tidak ada
+            if not os.path.exists(os.path.join("result", config.config_file)):
+                raise FileNotFoundError(config.config_file)
             config.load()
-            print("✓ Configuration loaded!")
-            render_with_config(config)
-        except:
-            print("✗ No saved configuration found. Run without arguments to configure first.")
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"✗ No saved configuration found ({e}). Run without arguments to configure first.")
             return
+        print("✓ Configuration loaded!")
+        options = {"workers": max(1, args.workers), "animation": args.animation, "fps": args.fps,
+                   "threads": args.threads, "engine": args.engine, "cross_check": args.cross_check}
+        if args.profile:
+            profile_render(config, **options)
+        else:
+            render_with_config(config, **options)
     else:
         print("=" * 70)
         print(" " * 15 + "ROCKET 3D RENDERER - GUI MODE v3")
@@ -166,7 +283,8 @@ def main():
         print("Please configure your camera and object settings in the GUI window.")
         print("\n" + "-" * 70 + "\n")
         
-        # Launch GUI
+        # Launch GUI (import di sini agar mode render tidak memuat Qt/Tk/pyplot)
+        from gui_input import GUIInput
         gui = GUIInput()
         config = gui.run()
         
@@ -0,0 +1,59 @@
+#ini file render_engine.py
+"""
+RenderEngine - Registry engine render yang bisa dipilih lewat config (render.engine) atau CLI
+Setiap engine adalah Renderer: render(voxel_data, camera, transform, centroid, stats=None) -> pixel
+Engine "reference" (loop per voxel) disimpan untuk cross-check engine yang dioptimasi
+"""
+import time
+
+import numpy as np
+
+from renderer import Renderer
+
+
+DEFAULT_ENGINE = "vectorized"
+
+
+class ReferenceEngine(Renderer):
+    """
+    Engine referensi: loop Python per voxel (Renderer.render_reference)
+
+    Sangat lambat dan selalu detail penuh (tanpa LOD, culling atau thread);
+    dipakai sebagai acuan kebenaran. stats hanya berisi waktu raster dan
+    jumlah voxel aktif.
+    """
+
+    def render(self, voxel_data, camera, transform, centroid, stats=None):
+        start = time.perf_counter()
+        pixel = self.render_reference(voxel_data, camera, transform, centroid)
+        if stats is not None:
+            stats["raster"] = stats.get("raster", 0.0) + time.perf_counter() - start
+            stats["active"] = len(self._active_voxels(voxel_data))
+        return pixel
+
+
+ENGINES = {
+    "reference": ReferenceEngine,
+    "vectorized": Renderer
+}
+
+
+def engine_class(name):
+    """Class engine terdaftar untuk name (reference, vectorized)"""
+    if name not in ENGINES:
+        raise ValueError(f"Unknown render engine: {name!r} (expected one of {sorted(ENGINES)})")
+    return ENGINES[name]
+
+
+def compare_images(expected, actual):
+    """Selisih dua frame (H, W, 3): jumlah & persentase pixel berbeda, selisih warna maksimum & rata-rata"""
+    if expected.shape != actual.shape:
+        raise ValueError(f"Frame shapes differ: {expected.shape} vs {actual.shape}")
+    diff = np.abs(expected.astype(np.int16) - actual.astype(np.int16))
+    differ = diff.any(axis=2)
+    return {
+        "pixels": int(differ.sum()),
+        "percent": round(float(differ.mean() * 100), 4),
+        "max_diff": int(diff.max()),
+        "mean_diff": round(float(diff.mean()), 4)
+    }
@@ -0,0 +1,131 @@
+#ini file render_report.py
+"""
+RenderReport - Laporan timing per stage & statistik voxel per frame (JSON)
+Ditulis di samping frame hasil render di folder result/
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows: tidak ada getrusage
+    resource = None
+
+
+# Urutan stage di laporan (extract..raster diukur oleh Renderer.render)
+STAGES = ("model", "extract", "cull", "transform", "projection", "raster", "encode")
+COUNTS = ("lod", "active", "culled", "clipped", "occluded", "drawn", "bricks", "bricks_culled",
+          "bricks_occluded", "fragments", "pixels")
+
+
+def peak_rss_mb(children=False):
+    """Peak resident memory proses ini (atau semua child yang sudah selesai) dalam MB"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss dalam KB di Linux, bytes di macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss / scale, 1)
+
+
+class RenderReport:
+    """Kumpulkan timing & statistik satu run render lalu simpan sebagai JSON"""
+
+    def __init__(self, settings=None):
+        self.settings = dict(settings or {})
+        self.model = {}
+        self.frames = []
+        self._frames_by_index = {}
+        self.stages = {name: 0.0 for name in STAGES}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name, frame_stats=None):
+        """Ukur blok kode sebagai stage; juga dicatat di frame_stats jika diberikan"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            if frame_stats is not None:
+                frame_stats[name] = frame_stats.get(name, 0.0) + elapsed
+
+    def set_model(self, source, seconds, voxel_count):
+        """Catat sumber model (cache/build), waktu load dan jumlah voxel"""
+        self.model = {"source": source, "seconds": round(seconds, 6), "voxels": int(voxel_count)}
+        self.stages["model"] += seconds
+
+    def add_frame(self, index, stats):
+        """Tambah statistik satu frame (dict dari Renderer.render + encode)"""
+        for name in STAGES[1:-1]:
+            self.stages[name] += stats.get(name, 0.0)
+        frame = {"index": int(index)}
+        frame["seconds"] = {name: round(stats[name], 6) for name in STAGES if name in stats}
+        frame["voxels"] = {name: int(stats[name]) for name in COUNTS if name in stats}
+        if stats.get("pixels"):
+            frame["overdraw"] = round(stats["fragments"] / stats["pixels"], 3)
+        if "peak_rss_mb" in stats:
+            frame["peak_rss_mb"] = stats["peak_rss_mb"]
+        self.frames.append(frame)
+        self._frames_by_index[frame["index"]] = frame
+
+    def add_encode(self, index, seconds):
+        """Catat waktu encode frame yang ditulis terpisah (mis. oleh FrameWriter)"""
+        self.stages["encode"] += seconds
+        frame = self._frames_by_index.get(int(index))
+        if frame is not None:
+            frame["seconds"]["encode"] = round(frame["seconds"].get("encode", 0.0) + seconds, 6)
+
+    def add_cross_check(self, index, diff):
+        """Catat selisih pixel frame terhadap engine pembanding (dict dari compare_images)"""
+        frame = self._frames_by_index.get(int(index))
+        if frame is not None:
+            frame["cross_check"] = dict(diff)
+
+    def cross_check_summary(self):
+        """Ringkasan cross-check: jumlah frame dicek, frame berbeda dan persentase pixel berbeda terbesar"""
+        checks = [f["cross_check"] for f in self.frames if "cross_check" in f]
+        if not checks:
+            return None
+        return {
+            "frames": len(checks),
+            "frames_differing": sum(1 for c in checks if c["pixels"] > 0),
+            "max_percent": max(c["percent"] for c in checks)
+        }
+
+    def overdraw(self):
+        """Rata-rata overdraw seluruh frame (fragment yang di-depth-test per pixel tertutup)"""
+        fragments = sum(f["voxels"].get("fragments", 0) for f in self.frames)
+        pixels = sum(f["voxels"].get("pixels", 0) for f in self.frames)
+        return fragments / pixels if pixels else None
+
+    def to_dict(self):
+        frame_times = [sum(f["seconds"].values()) for f in self.frames]
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "settings": self.settings,
+            "model": self.model,
+            "total_seconds": round(time.perf_counter() - self._start, 6),
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "frame_count": len(self.frames),
+            "mean_frame_seconds": round(sum(frame_times) / len(frame_times), 6) if frame_times else 0.0,
+            "overdraw": round(self.overdraw(), 3) if self.overdraw() is not None else None,
+            "cross_check": self.cross_check_summary(),
+            "peak_memory_mb": {
+                "main": peak_rss_mb(),
+                "workers": peak_rss_mb(children=True)
+            },
+            "frames": self.frames
+        }
+
+    def save(self, filename="render_report.json"):
+        """Simpan laporan ke result/<filename>"""
+        os.makedirs("result", exist_ok=True)
+        filepath = os.path.join("result", filename)
+        with open(filepath, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return filepath
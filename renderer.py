@@ -6,24 +6,463 @@ Fitur Baru: Solid Splatting (mengisi celah antar pixel agar tidak 'bolong-bolong
 """
 import numpy as np
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from voxel_set import VoxelSet, box_corners
+
+
+def _add_time(stats, stage, start):
+    """Tambah waktu sejak start ke stats[stage] (jika stats diminta); return waktu sekarang"""
+    now = time.perf_counter()
+    if stats is not None:
+        stats[stage] = stats.get(stage, 0.0) + now - start
+    return now
 
 
 class Renderer:
     """Class untuk rendering voxel 3D ke 2D image"""
     
-    def __init__(self, width=640, height=480, fov=50, threshold=10):
+    # Jumlah voxel yang diproses sekaligus oleh render()
+    chunk_size = 262144
+    # Buang brick voxel di luar view frustum sebelum transform per voxel
+    brick_culling = True
+    # Batas aman (pixel) di luar layar: half splat maksimum (10) + pembulatan
+    cull_margin = 12
+    # Ukuran tile (pixel) level 0 hierarchical depth buffer (Hi-Z)
+    hiz_tile = 8
+    # Jumlah voxel per batch depan-ke-belakang; Hi-Z diperbarui di antara batch
+    occlusion_batch = 65536
+    
+    def __init__(self, width=640, height=480, fov=50, threshold=10, lod=0.0, occlusion=False, threads=1):
         self.width = width
         self.height = height
         self.fov = np.radians(fov)
         self.threshold = threshold
         self.f = 1.0 / np.tan(self.fov / 2)  # Focal length
+        # LOD: ukuran proyeksi maksimum (pixel) voxel level kasar; 0 = selalu detail penuh
+        self.lod = lod
+        # Occlusion culling: brick depan-ke-belakang, brick yang tertutup Hi-Z dilewati
+        self.occlusion_culling = occlusion
+        # Thread rasterizer: > 1 = depth test per tile baris layar di thread pool
+        self.threads = max(1, int(threads))
+        self._pool = None
+    
+    def close(self):
+        """
+        Hentikan thread pool rasterizer (jika sudah dibuat)
+        
+        Renderer tetap bisa dipakai: pool dibuat lagi saat render berikutnya.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def _active_voxels(self, voxel_data):
+        """
+        Ambil voxel aktif (jumlah RGB > threshold) sebagai VoxelSet
+        
+        voxel_data boleh VoxelSet atau grid dense (Y, X, Z, 3[RGB])
+        """
+        if not isinstance(voxel_data, VoxelSet):
+            voxel_data = VoxelSet.from_dense(voxel_data)
+        return voxel_data.active(self.threshold)
+    
+    def render(self, voxel_data, camera, transform, centroid, stats=None):
+        """
+        Render voxel dengan transformasi dan Solid Splatting (versi vectorized)
+        
+        Semua voxel aktif di-transform, diproyeksikan, di-clip dan di-depth-test
+        sebagai array sekaligus. Hasilnya pixel-identik dengan render_reference().
+        
+        Args:
+            voxel_data: VoxelSet (atau grid dense numpy) voxel rocket
+            camera: Camera object
+            transform: Transform object (with scale support)
+            centroid: (cx, cy, cz) centroid rocket
+            stats: dict opsional; diisi level LOD (lod), waktu per stage
+                (extract, cull, transform, projection, raster dalam detik), jumlah voxel
+                (active, culled = dibuang per brick, clipped = di belakang
+                near plane / di luar layar termasuk culled, occluded = dibuang
+                oleh occlusion culling, drawn = terlihat di minimal satu pixel),
+                jumlah brick (bricks, bricks_culled, bricks_occluded) serta
+                fragments (splat pixel yang di-depth-test) dan pixels (pixel
+                tertutup); overdraw = fragments / pixels
+        
+        Returns:
+            pixel: numpy array (height, width, 3) RGB image
+        """
+        t = time.perf_counter()
+        pixel = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        
+        centroid_x, centroid_y, centroid_z = centroid
+        viewport_scale = self.width // 3
+        proj_const = self.f * viewport_scale
+        
+        # Model + view matrix digabung sekali per pose
+        model_view = camera.get_view_matrix() @ transform.get_matrix(centroid_x, centroid_y, centroid_z)
+        
+        voxels = self._active_voxels(self._select_lod(voxel_data, model_view, proj_const, stats))
+        t = _add_time(stats, "extract", t)
+        if stats is not None:
+            stats.update(active=len(voxels), culled=0, clipped=0, occluded=0, drawn=0,
+                         fragments=0, pixels=0)
+        
+        if len(voxels) == 0:
+            return pixel
+        
+        # Voxel level LOD mewakili scale^3 voxel asli: titik di tengah blok, splat lebih besar
+        scale = voxels.scale
+        splat_const = proj_const * scale
+        
+        n_pixels = self.width * self.height
+        depth_flat = np.full(n_pixels, 1e9, dtype=float)
+        owner_flat = np.full(n_pixels, -1, dtype=np.int64)
+        
+        # 0. Culling per brick; ids None = semua voxel diproses. Waktu generator
+        # batch (frustum, urutan brick, Hi-Z) tercatat sebagai stage cull
+        for ids in self._voxel_batches(voxels, model_view, proj_const, depth_flat, stats):
+            count = len(voxels) if ids is None else len(ids)
+            t = _add_time(stats, "cull", t)
+            
+            # Diproses per chunk agar memori kerja tetap kecil untuk model besar
+            for start in range(0, count, self.chunk_size):
+                end = start + self.chunk_size
+                chunk = slice(start, end) if ids is None else ids[start:end]
+                
+                # 1 & 2. Transform + world to camera dengan 1 matmul
+                # Koordinat voxel (x=j, y=i, z=k)
+                points = np.column_stack((voxels.x[chunk], voxels.y[chunk], voxels.z[chunk])).astype(float)
+                if scale != 1:
+                    points = points * scale + (scale - 1) / 2
+                cam_points = points @ model_view[:3, :3].T + model_view[:3, 3]
+                t = _add_time(stats, "transform", t)
+                
+                # Clipping plane dekat
+                visible = cam_points[:, 2] > 5
+                cam_x, cam_y, cam_z = cam_points[visible].T
+                voxel_ids = start + np.flatnonzero(visible) if ids is None else chunk[visible].astype(np.int64)
+                
+                # 3. Perspective projection (astype int64 = truncation seperti int())
+                center_x = (self.width // 2 + proj_const * cam_x / cam_z).astype(np.int64)
+                center_y = (self.height // 2 - proj_const * cam_y / cam_z).astype(np.int64)
+                size = np.clip((splat_const / cam_z).astype(np.int64) + 1, 1, 20)
+                half_size = size // 2
+                if stats is not None:
+                    on_screen = ((center_x + half_size >= 0) & (center_x - half_size < self.width) &
+                                 (center_y + half_size >= 0) & (center_y - half_size < self.height))
+                    stats["clipped"] += len(points) - int(on_screen.sum())
+                t = _add_time(stats, "projection", t)
+                
+                # 4. Per-pixel minimum-depth resolve
+                fragments = self._rasterize(center_x, center_y, half_size, cam_z, voxel_ids,
+                                            depth_flat, owner_flat)
+                if stats is not None:
+                    stats["fragments"] += fragments
+                t = _add_time(stats, "raster", t)
+        
+        drawn = np.flatnonzero(owner_flat >= 0)
+        if len(drawn) == 0:
+            return pixel
+        owners = owner_flat[drawn]
+        pixel.reshape(-1, 3)[drawn] = voxels.colors[owners]
+        if stats is not None:
+            visible_voxels = np.zeros(len(voxels), dtype=bool)
+            visible_voxels[owners] = True
+            stats["drawn"] = int(visible_voxels.sum())
+            stats["pixels"] = len(drawn)
+        _add_time(stats, "raster", t)
+        return pixel
+    
+    def _select_lod(self, voxel_data, model_view, proj_const, stats=None):
+        """
+        Pilih level LOD terkasar yang voxel-nya masih <= self.lod pixel di titik terdekat objek
+        
+        Ukuran proyeksi voxel level f kira-kira f * proj_const / cam_z; cam_z
+        diambil dari sudut bounding box objek yang paling dekat ke kamera,
+        sehingga bagian objek yang terdekat pun tidak lebih kasar dari batas.
+        Return VoxelSet level terpilih (atau voxel_data apa adanya).
+        """
+        factor = 1
+        if (self.lod > 0 and isinstance(voxel_data, VoxelSet) and voxel_data.lods
+                and len(voxel_data) > 0):
+            lo, hi = voxel_data.bounds()
+            corners = box_corners(lo, hi)[0] @ model_view[:3, :3].T + model_view[:3, 3]
+            nearest = corners[:, 2].min()
+            if nearest > 5:
+                for level in sorted(voxel_data.lods):
+                    if level * proj_const / nearest <= self.lod:
+                        factor = level
+        if stats is not None:
+            stats["lod"] = factor
+        return voxel_data.lod(factor) if factor > 1 else voxel_data
+    
+    def _brick_frustum(self, voxels, model_view, proj_const):
+        """
+        Sudut brick di camera space + mask brick di luar frustum
+        
+        Return (bricks, corners (K, 8, 3), outside (K,)). Brick di luar jika
+        ke-8 sudutnya berada di luar satu bidang frustum yang sama (near
+        plane z > 5, atau sisi layar diperlebar cull_margin pixel).
+        """
+        bricks = voxels.bricks()
+        scale = voxels.scale
+        corners = (bricks.corners() * scale + (scale - 1) / 2) @ model_view[:3, :3].T + model_view[:3, 3]
+        x, y, z = corners[..., 0], corners[..., 1], corners[..., 2]
+        left = self.width // 2 + self.cull_margin
+        right = self.width - self.width // 2 + self.cull_margin
+        top = self.height // 2 + self.cull_margin
+        bottom = self.height - self.height // 2 + self.cull_margin
+        
+        outside = ((z <= 5).all(axis=1) |
+                   (proj_const * x + left * z < 0).all(axis=1) |
+                   (right * z - proj_const * x < 0).all(axis=1) |
+                   (top * z - proj_const * y < 0).all(axis=1) |
+                   (proj_const * y + bottom * z < 0).all(axis=1))
+        return bricks, corners, outside
+    
+    def _cull_bricks(self, voxels, model_view, proj_const, stats=None):
+        """
+        Frustum culling brick: return index voxel (urut naik) di brick yang
+        mungkin terlihat, atau None jika tidak ada brick yang dibuang
+        
+        Karena transform affine, seluruh isi brick yang sudutnya di luar
+        frustum pasti ikut di luar, sehingga hasil render tidak berubah.
+        """
+        if stats is not None:
+            stats.update(bricks=len(voxels.bricks()), bricks_culled=0)
+        if len(voxels.bricks()) == 0:
+            return None
+        
+        bricks, _, outside = self._brick_frustum(voxels, model_view, proj_const)
+        if not outside.any():
+            return None
+        
+        ids = bricks.voxel_ids(~outside)
+        if stats is not None:
+            stats["bricks_culled"] = int(outside.sum())
+            stats["culled"] = len(voxels) - len(ids)
+            stats["clipped"] += stats["culled"]
+        return ids
+    
+    def _voxel_batches(self, voxels, model_view, proj_const, depth_flat, stats=None):
+        """
+        Generator batch index voxel yang di-render (None = semua voxel)
+        
+        Tanpa occlusion culling hanya ada satu batch hasil _cull_bricks.
+        Dengan occlusion culling brick yang lolos frustum diurutkan
+        depan-ke-belakang (z sudut terdekat) lalu di-render per sekitar
+        occlusion_batch voxel. Sebelum setiap batch, Hi-Z dibangun dari
+        depth_flat yang sudah diisi batch sebelumnya; brick yang seluruhnya
+        di belakang Hi-Z di area layarnya dilewati tanpa transform per voxel.
+        """
+        if stats is not None:
+            stats.update(bricks_occluded=0)
+        if not (self.brick_culling and self.occlusion_culling) or len(voxels.bricks()) == 0:
+            yield self._cull_bricks(voxels, model_view, proj_const, stats) if self.brick_culling else None
+            return
+        
+        bricks, corners, outside = self._brick_frustum(voxels, model_view, proj_const)
+        counts = np.diff(bricks.starts)
+        if stats is not None:
+            stats.update(bricks=len(bricks), bricks_culled=int(outside.sum()),
+                         culled=int(counts[outside].sum()))
+            stats["clipped"] += stats["culled"]
+        
+        keep = np.flatnonzero(~outside)
+        near = corners[keep, :, 2].min(axis=1)
+        front_to_back = np.argsort(near, kind="stable")
+        keep, near = keep[front_to_back], near[front_to_back]
+        rects = self._brick_rects(corners[keep], proj_const, voxels.scale)
+        
+        # Batch: brick berurutan yang offset voxel awalnya jatuh di kelipatan occlusion_batch yang sama
+        offsets = np.cumsum(counts[keep]) - counts[keep]
+        splits = np.flatnonzero(np.diff(offsets // self.occlusion_batch)) + 1
+        for n, batch in enumerate(np.split(np.arange(len(keep)), splits)):
+            if n > 0:
+                hidden = self._occluded(rects[batch], near[batch], self._build_hiz(depth_flat))
+                if stats is not None:
+                    stats["bricks_occluded"] += int(hidden.sum())
+                    stats["occluded"] += int(counts[keep[batch[hidden]]].sum())
+                batch = batch[~hidden]
+            if len(batch) > 0:
+                yield bricks.brick_voxel_ids(keep[batch])
+    
+    def _brick_rects(self, corners, proj_const, scale=1):
+        """
+        Kotak layar (x0, y0, x1, y1) inklusif yang bisa disentuh splat voxel brick
+        
+        Proyeksi isi brick ada di dalam kotak proyeksi sudut-sudutnya, lalu
+        diperlebar half splat terbesar brick (dari z terdekat) + 1 pixel
+        pembulatan dan di-clamp ke layar. Brick yang punya sudut di depan
+        near plane diberi kotak selebar layar.
+        """
+        x, y, z = corners[..., 0], corners[..., 1], corners[..., 2]
+        in_front = (z > 5).all(axis=1)
+        z = np.where(z > 5, z, 1.0)
+        screen_x = self.width // 2 + proj_const * x / z
+        screen_y = self.height // 2 - proj_const * y / z
+        size = np.clip((proj_const * scale / z.min(axis=1)).astype(np.int64) + 1, 1, 20)
+        margin = size // 2 + 1
+        rects = np.column_stack((
+            np.floor(screen_x.min(axis=1)) - margin,
+            np.floor(screen_y.min(axis=1)) - margin,
+            np.ceil(screen_x.max(axis=1)) + margin,
+            np.ceil(screen_y.max(axis=1)) + margin
+        ))
+        rects[~in_front] = (0, 0, self.width - 1, self.height - 1)
+        rects = np.clip(rects, 0, [self.width - 1, self.height - 1, self.width - 1, self.height - 1])
+        return rects.astype(np.int64)
+    
+    def _build_hiz(self, depth_flat):
+        """
+        Hierarchical depth buffer: list level, level 0 = depth maksimum per
+        tile hiz_tile x hiz_tile pixel, level berikutnya = maksimum 2x2 tile
+        """
+        tile = self.hiz_tile
+        rows, cols = -(-self.height // tile), -(-self.width // tile)
+        padded = np.full((rows * tile, cols * tile), -np.inf)
+        padded[:self.height, :self.width] = depth_flat.reshape(self.height, self.width)
+        level = padded.reshape(rows, tile, cols, tile).max(axis=(1, 3))
+        levels = [level]
+        while level.shape != (1, 1):
+            rows, cols = level.shape
+            padded = np.full((rows + rows % 2, cols + cols % 2), -np.inf)
+            padded[:rows, :cols] = level
+            level = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2).max(axis=(1, 3))
+            levels.append(level)
+        return levels
+    
+    def _occluded(self, rects, near, hiz):
+        """
+        Mask brick yang seluruhnya tertutup: z terdekat brick lebih besar dari
+        depth maksimum Hi-Z di kotak layarnya
+        
+        Setiap brick dibaca di level terkecil di mana kotaknya paling banyak
+        2x2 tile, sehingga cukup 4 lookup per brick. Perbandingan strict
+        (dengan toleransi pembulatan) menjamin voxel brick itu tidak akan
+        menang depth test di pixel mana pun, jadi hasil render tidak berubah.
+        """
+        x0, y0, x1, y1 = (rects // self.hiz_tile).T
+        span = np.maximum(x1 - x0, y1 - y0)
+        levels = np.minimum(np.ceil(np.log2(span + 1)).astype(np.int64), len(hiz) - 1)
+        
+        depth = np.empty(len(rects))
+        for level in np.unique(levels):
+            group = levels == level
+            buffer = hiz[level]
+            gx0, gy0, gx1, gy1 = x0[group] >> level, y0[group] >> level, x1[group] >> level, y1[group] >> level
+            depth[group] = np.maximum(np.maximum(buffer[gy0, gx0], buffer[gy0, gx1]),
+                                      np.maximum(buffer[gy1, gx0], buffer[gy1, gx1]))
+        return near - 1e-6 > depth
     
-    def render(self, voxel_data, camera, transform, centroid):
+    def _splat_fragments(self, center_x, center_y, half_size, depth, voxel_ids, rows=None):
         """
-        Render voxel dengan transformasi dan Solid Splatting
+        Generator fragment splat: (flat pixel index, depth, voxel id)
+        
+        Voxel dikelompokkan per half_size sehingga setiap offset dalam kotak
+        splat hanya diproses untuk voxel yang memang menutupinya. rows=(y0, y1)
+        membatasi fragment ke baris y0 <= y < y1 (index pixel relatif ke y0).
+        """
+        y0, y1 = rows or (0, self.height)
+        for half in np.unique(half_size):
+            group = half_size == half
+            gx, gy = center_x[group], center_y[group]
+            gd, gv = depth[group], voxel_ids[group]
+            
+            # Buang voxel yang kotak splat-nya sepenuhnya di luar layar
+            on_screen = ((gx + half >= 0) & (gx - half < self.width) &
+                         (gy + half >= y0) & (gy - half < y1))
+            gx, gy, gd, gv = gx[on_screen], gy[on_screen], gd[on_screen], gv[on_screen]
+            if len(gx) == 0:
+                continue
+            
+            for oy in range(-half, half + 1):
+                py = gy + oy
+                row_ok = (py >= y0) & (py < y1)
+                for ox in range(-half, half + 1):
+                    px = gx + ox
+                    ok = row_ok & (px >= 0) & (px < self.width)
+                    yield (py[ok] - y0) * self.width + px[ok], gd[ok], gv[ok]
+    
+    def _rasterize(self, center_x, center_y, half_size, depth, voxel_ids, depth_flat, owner_flat):
+        """
+        Depth test satu chunk splat, serial atau per tile di thread pool
+        
+        Dengan threads > 1 layar dibagi menjadi tile baris (satu per thread)
+        dengan beban fragment yang kira-kira sama. Setiap tile me-resolve
+        splat yang menyentuh barisnya ke potongan depth_flat/owner_flat miliknya
+        sendiri, sehingga tidak perlu lock; kernel NumPy melepas GIL. Hasilnya
+        sama persis dengan jalur serial karena setiap pixel tetap memilih
+        (depth, voxel id) terkecil. Return jumlah fragment.
+        """
+        if self.threads <= 1 or len(center_x) == 0:
+            return self._resolve_splats(center_x, center_y, half_size, depth, voxel_ids, depth_flat, owner_flat)
+        
+        edges = self._tile_rows(center_y, half_size, self.threads)
+        
+        def resolve_tile(y0, y1):
+            # Bin: hanya splat yang kotaknya menyentuh baris tile ini
+            hit = (center_y + half_size >= y0) & (center_y - half_size < y1)
+            tile = slice(y0 * self.width, y1 * self.width)
+            return self._resolve_splats(center_x[hit], center_y[hit], half_size[hit], depth[hit], voxel_ids[hit],
+                                        depth_flat[tile], owner_flat[tile], rows=(y0, y1))
+        
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.threads, thread_name_prefix="raster")
+        return sum(self._pool.map(resolve_tile, edges[:-1], edges[1:]))
+    
+    def _tile_rows(self, center_y, half_size, count):
+        """Batas baris count tile layar (array naik, 0..height) dengan jumlah fragment mirip"""
+        area = (2 * half_size + 1) ** 2
+        weight = np.bincount(np.clip(center_y, 0, self.height - 1), weights=area, minlength=self.height)
+        total = np.cumsum(weight)
+        cuts = np.searchsorted(total, total[-1] * np.arange(1, count) / count) + 1
+        return np.unique(np.concatenate(([0], np.minimum(cuts, self.height), [self.height])))
+    
+    def _resolve_splats(self, center_x, center_y, half_size, depth, voxel_ids, depth_flat, owner_flat, rows=None):
+        """
+        Depth test satu chunk fragment splat ke depth_flat/owner_flat (in-place)
+        
+        Pass 1 mencari depth minimum per pixel, pass 2 memilih voxel pertama
+        (urutan np.where) yang mencapai depth itu. Chunk menimpa pixel jika
+        (depth, voxel id)-nya lebih kecil, sama seperti loop referensi di mana
+        voxel pertama menang saat depth sama, berapa pun urutan chunk-nya.
+        rows=(y0, y1): depth_flat/owner_flat hanya potongan baris y0..y1.
+        Return jumlah fragment (pixel splat) yang di-depth-test.
+        """
+        n_pixels = len(depth_flat)
+        chunk_depth = np.full(n_pixels, 1e9, dtype=float)
+        fragments = 0
+        for p, d, _ in self._splat_fragments(center_x, center_y, half_size, depth, voxel_ids, rows):
+            np.minimum.at(chunk_depth, p, d)
+            fragments += len(p)
+        
+        chunk_owner = np.full(n_pixels, np.iinfo(np.int64).max, dtype=np.int64)
+        for p, d, v in self._splat_fragments(center_x, center_y, half_size, depth, voxel_ids, rows):
+            winner = d == chunk_depth[p]
+            np.minimum.at(chunk_owner, p[winner], v[winner])
+        
+        update = (chunk_depth < depth_flat) | ((chunk_depth == depth_flat) & (chunk_owner < owner_flat))
+        depth_flat[update] = chunk_depth[update]
+        owner_flat[update] = chunk_owner[update]
+        return fragments
+    
+    def render_reference(self, voxel_data, camera, transform, centroid):
+        """
+        Render voxel dengan transformasi dan Solid Splatting (loop per voxel)
+        
+        Implementasi referensi yang lambat, disimpan untuk pengecekan
+        kebenaran engine vectorized.
         
         Args:
-            voxel_data: numpy array voxel rocket
+            voxel_data: VoxelSet (atau grid dense numpy) voxel rocket
             camera: Camera object
             transform: Transform object (with scale support)
             centroid: (cx, cy, cz) centroid rocket
@@ -36,9 +475,9 @@ class Renderer:
         # Depth buffer diisi infinity
         depth_buffer = np.full((self.height, self.width), 1e9, dtype=float)
         
-        # Cari koordinat voxel yang ada isinya (optimasi: tidak loop semua koordinat kosong)
-        # axis=3 karena shape voxel adalah (Y, X, Z, 3[RGB])
-        y_indices, x_indices, z_indices = np.where(np.sum(voxel_data, axis=3) > self.threshold)
+        # Ambil hanya voxel yang ada isinya (optimasi: tidak loop semua koordinat kosong)
+        voxels = self._active_voxels(voxel_data)
+        y_indices, x_indices, z_indices = voxels.y, voxels.x, voxels.z
         
         if len(y_indices) == 0:
             return pixel
@@ -51,7 +490,7 @@ class Renderer:
         proj_const = self.f * viewport_scale
 
         # Loop hanya pada voxel yang aktif (Jauh lebih cepat dari nested loop range)
-        for i, j, k in zip(y_indices, x_indices, z_indices):
+        for n, (i, j, k) in enumerate(zip(y_indices, x_indices, z_indices)):
             
             # 1. Transform point (scale + rotation + translation)
             # Koordinat voxel (j=x, i=y, k=z)
@@ -97,7 +536,7 @@ class Renderer:
             if start_x >= end_x or start_y >= end_y:
                 continue
                 
-            color = voxel_data[i, j, k]
+            color = voxels.colors[n]
             
             # 4. Draw Rectangle (Splatting) dengan Depth Test
             # Kita loop area kecil ini (misal 2x2 atau 3x3 pixel)
@@ -120,47 +559,42 @@ class Renderer:
     
     def npy_to_jpg(self, npy_path, jpg_filename):
         """Convert .npy file ke .jpg"""
-        import matplotlib
-        matplotlib.use('Agg')
-        from matplotlib import pyplot as plt
+        # matplotlib.image cukup untuk encode, tanpa memuat pyplot/backend
+        from matplotlib import image as mpimg
         
         pixel = np.load(npy_path)
         os.makedirs("result/jpg_frames", exist_ok=True)
         filepath = os.path.join("result/jpg_frames", jpg_filename)
-        plt.imsave(filepath, pixel)
+        mpimg.imsave(filepath, pixel)
         return filepath
     
     def save_image(self, pixel, filename):
         """Simpan image ke file in result folder"""
-        import matplotlib
-        matplotlib.use('Agg')
-        from matplotlib import pyplot as plt
+        # matplotlib.image cukup untuk encode, tanpa memuat pyplot/backend
+        from matplotlib import image as mpimg
         os.makedirs("result", exist_ok=True)
         filepath = os.path.join("result", filename)
         # Menggunakan format jpg dengan kualitas tinggi
-        plt.imsave(filepath, pixel, format='jpg')
+        mpimg.imsave(filepath, pixel, format='jpg')
         return filepath
     
-    def display_images(self, images, titles=None):
-        """Display multiple images"""
-        import matplotlib
-        matplotlib.use('Agg')
-        from matplotlib import pyplot as plt
+    def display_images(self, images, titles=None, columns=None, factor=1):
+        """
+        Simpan beberapa image sebagai satu contact sheet (grid) di result/rocket_display.png
+        
+        Args:
+            images: list frame (H, W, 3)
+            titles: label per frame (opsional)
+            columns: jumlah kolom grid (default mendekati persegi)
+            factor: faktor downsample setiap frame (1 = ukuran asli)
+        """
+        # Tiling NumPy + label Pillow; tidak perlu pyplot / layout figure
+        from contact_sheet import save_contact_sheet
         
-        n = len(images)
-        if n == 0:
+        if len(images) == 0:
             return
         
-        plt.figure(figsize=(5 * n, 5))
-        for i, img in enumerate(images):
-            plt.subplot(1, n, i + 1)
-            plt.imshow(img)
-            if titles and i < len(titles):
-                plt.title(titles[i])
-            plt.axis('off')
-        plt.tight_layout()
         os.makedirs("result", exist_ok=True)
         filepath = os.path.join("result", "rocket_display.png")
-        plt.savefig(filepath, dpi=100, bbox_inches='tight')
-        plt.close()
-        print(f"Rendered image saved to: {filepath}")
\ No newline at end of file
+        save_contact_sheet(images, filepath, titles, columns, factor)
+        print(f"Rendered image saved to: {filepath}")
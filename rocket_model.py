@@ -1,6 +1,15 @@
 import numpy as np
-import pickle
+import hashlib
+import inspect
+import json
 import os
+import shutil
+import voxel_set
+from voxel_set import VoxelSet
+
+CACHE_DIR = "cache"
+# Naikkan jika layout file cache berubah
+CACHE_FORMAT_VERSION = 3
 
 class RocketModel:
     """Class untuk membangun dan menyimpan model voxel rocket lengkap (ET, SRB, dan Orbiter)"""
@@ -13,8 +22,13 @@ class RocketModel:
         self.length = length
         self.cx, self.cy, self.cz = self.col // 2, self.row // 2, self.length // 2
         
-        # Inisialisasi Voxel Grid (Array 3D)
-        self.voxel = np.zeros((self.row, self.col, self.length, 3), dtype=np.uint8)
+        # Voxel Grid dense hanya dipakai sementara selama build_reference();
+        # build() mencatat tulisan sparse per komponen di self._writes
+        # Hasil akhir model disimpan sparse di self.voxels (VoxelSet)
+        self.voxel = None
+        self._writes = []
+        self.voxels = None
+        self.surface_voxels = None
         
         # --- PALET WARNA REALISTIS (Dengan Shading) ---
         # Putih Orbiter
@@ -31,49 +45,130 @@ class RocketModel:
         self.C_BLUE_NASA    = [ 10,  60, 180]
         self.C_WINDOW_GLINT = [150, 220, 255]
         self.C_GREY_NOZZLE  = [100, 100, 100]
+        
+        # Asumsi cahaya datang dari Kanan-Depan-Atas (dinormalisasi sekali)
+        light_dir = np.array([0.6, 0.4, 0.7])
+        self.light_dir = light_dir / np.linalg.norm(light_dir)
 
     def get_centroid(self):
         """Mengembalikan titik pusat roket (untuk keperluan visualisasi/rotasi)"""
         return np.array([self.cx, self.cy, self.cz])
     
+    @staticmethod
+    def cache_key(col=320, row=450, length=320):
+        """
+        Key cache: hash dari parameter builder + source code builder
+        
+        Cache otomatis tidak dipakai lagi jika dimensi, kode build() atau modul
+        voxel_set (VoxelSet, BrickIndex, box_corners, ...) berubah.
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps({"col": col, "row": row, "length": length,
+                                  "format": CACHE_FORMAT_VERSION}).encode())
+        digest.update(inspect.getsource(RocketModel).encode())
+        digest.update(inspect.getsource(voxel_set).encode())
+        return digest.hexdigest()[:16]
+    
     def save_cache(self):
-        """Simpan voxel data ke cache file"""
-        os.makedirs("cache", exist_ok=True)
-        cache_file = "cache/rocket_model.pkl"
-        cache_data = {
-            "voxel": self.voxel,
-            "centroid": self.get_centroid(),
+        """
+        Simpan voxel data ke cache (.npy + manifest.json)
+        
+        Ditulis ke folder sementara lalu di-rename, sehingga proses lain tidak
+        pernah membaca cache yang setengah jadi.
+        """
+        key = self.cache_key(self.col, self.row, self.length)
+        cache_dir = os.path.join(CACHE_DIR, key)
+        tmp_dir = f"{cache_dir}.tmp{os.getpid()}"
+        os.makedirs(tmp_dir, exist_ok=True)
+        
+        # Brick index & piramida LOD ikut disimpan agar renderer tidak membangunnya lagi
+        for voxels, prefix in ((self.voxels, "voxels"), (self.surface_voxels, "surface")):
+            for level in [voxels] + list(voxels.build_lods().values()):
+                level.bricks()
+            voxels.save(tmp_dir, prefix)
+        manifest = {
+            "key": key,
+            "format": CACHE_FORMAT_VERSION,
+            "centroid": self.get_centroid().tolist(),
             "col": self.col,
             "row": self.row,
-            "length": self.length
+            "length": self.length,
+            "voxel_count": len(self.voxels),
+            "surface_count": len(self.surface_voxels)
         }
-        with open(cache_file, 'wb') as f:
-            pickle.dump(cache_data, f)
-        print(f"✓ Model cached to {cache_file}")
+        with open(os.path.join(tmp_dir, "manifest.json"), 'w') as f:
+            json.dump(manifest, f, indent=2)
+        
+        try:
+            os.replace(tmp_dir, cache_dir)
+        except OSError:
+            # Proses lain sudah menulis cache dengan key yang sama
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        print(f"✓ Model cached to {cache_dir}")
+        self.prune_cache(key)
     
-    @staticmethod
-    def load_cache():
-        """Load voxel data dari cache file"""
-        cache_file = "cache/rocket_model.pkl"
-        if os.path.exists(cache_file):
+    def prune_cache(self, keep_key):
+        """
+        Hapus folder cache lama untuk dimensi model yang sama (key lain)
+        
+        Setiap perubahan kode build()/VoxelSet menghasilkan key baru, sehingga
+        tanpa ini folder lama (~37 MB) terus menumpuk. Folder sementara
+        (.tmp<pid>) milik proses lain tidak disentuh.
+        """
+        if not os.path.isdir(CACHE_DIR):
+            return
+        for name in os.listdir(CACHE_DIR):
+            path = os.path.join(CACHE_DIR, name)
+            if name == keep_key or ".tmp" in name or not os.path.isdir(path):
+                continue
             try:
-                with open(cache_file, 'rb') as f:
-                    cache_data = pickle.load(f)
-                print("✓ Model loaded from cache (fast!)")
-                return cache_data
-            except:
-                return None
-        return None
+                with open(os.path.join(path, "manifest.json"), 'r') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            # Folder tanpa manifest valid adalah sisa cache rusak; dimensi lain dibiarkan
+            if manifest and (manifest.get("col"), manifest.get("row"), manifest.get("length")) != \
+                    (self.col, self.row, self.length):
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            print(f"✓ Removed stale model cache {path}")
+    
+    @staticmethod
+    def load_cache(col=320, row=450, length=320):
+        """
+        Load voxel data dari cache (memory-mapped, hampir instan)
+        
+        Returns: dict dengan "voxels", "surface", "centroid", "col", "row",
+        "length" dan "manifest", atau None jika cache belum ada / tidak valid.
+        """
+        cache_dir = os.path.join(CACHE_DIR, RocketModel.cache_key(col, row, length))
+        manifest_file = os.path.join(cache_dir, "manifest.json")
+        if not os.path.exists(manifest_file):
+            return None
+        try:
+            with open(manifest_file, 'r') as f:
+                manifest = json.load(f)
+            shape = (manifest["row"], manifest["col"], manifest["length"])
+            cache_data = {
+                "voxels": VoxelSet.load(cache_dir, "voxels", shape),
+                "surface": VoxelSet.load(cache_dir, "surface", shape),
+                "centroid": np.array(manifest["centroid"]),
+                "col": manifest["col"],
+                "row": manifest["row"],
+                "length": manifest["length"],
+                "manifest": manifest
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+        print("✓ Model loaded from cache (fast!)")
+        return cache_data
 
     def get_color_shaded(self, x, y, z, nx, ny, nz, c_lit, c_shade):
         """Menghitung warna berdasarkan pencahayaan (Shading)"""
-        # Asumsi cahaya datang dari Kanan-Depan-Atas
-        light_dir = np.array([0.6, 0.4, 0.7])
-        light_dir = light_dir / np.linalg.norm(light_dir)
         normal = np.array([nx, ny, nz])
         
         # Intensitas cahaya (diffuse)
-        intensity = np.dot(normal, light_dir)
+        intensity = np.dot(normal, self.light_dir)
         
         # Interpolasi warna berdasarkan intensitas
         factor = max(0, min(1, intensity + 0.3)) # +0.3 untuk ambient light
@@ -83,15 +178,56 @@ class RocketModel:
         b = int(c_shade[2] + (c_lit[2] - c_shade[2]) * factor)
         return [r, g, b]
 
+    def get_color_shaded_many(self, nx, ny, nz, c_lit, c_shade):
+        """
+        Versi vectorized dari get_color_shaded
+        
+        nx, ny, nz: array (atau skalar) normal per voxel
+        c_lit, c_shade: warna (3,) atau array (N, 3) per voxel
+        Returns: array (N, 3) int64
+        """
+        nx, ny, nz = np.broadcast_arrays(np.asarray(nx, dtype=float), ny, nz)
+        normals = np.stack((nx, ny, nz), axis=-1).astype(float)
+        
+        # vecdot memakai kernel dot yang sama dengan np.dot -> hasil bit-identik
+        intensity = np.vecdot(normals, self.light_dir)
+        factor = np.asarray(np.clip(intensity + 0.3, 0, 1))[..., None]
+        
+        c_lit = np.asarray(c_lit, dtype=np.int64)
+        c_shade = np.asarray(c_shade, dtype=np.int64)
+        return (c_shade + (c_lit - c_shade) * factor).astype(np.int64)
+
     def set_vox(self, y, x, z, color):
         """Helper aman untuk set voxel"""
         if 0 <= y < self.row and 0 <= x < self.col and 0 <= z < self.length:
             self.voxel[y, x, z] = color
 
-    def build(self):
-        """Fungsi utama untuk merakit model"""
+    def set_vox_many(self, y, x, z, colors):
+        """
+        Versi batch dari set_vox (koordinat di luar grid diabaikan)
+        
+        Tidak menulis ke grid dense: index sel (C-order) + warna uint8 dicatat
+        di self._writes dan digabung di _finish_build (tulisan terakhir per sel
+        yang menang, sama seperti menimpa grid berurutan).
+        """
+        y, x, z = np.broadcast_arrays(y, x, z)
+        colors = np.broadcast_to(np.asarray(colors), y.shape + (3,))
+        inside = ((y >= 0) & (y < self.row) & (x >= 0) & (x < self.col) &
+                  (z >= 0) & (z < self.length))
+        cells = (y[inside].astype(np.int64) * self.col + x[inside]) * self.length + z[inside]
+        self._writes.append((cells, colors[inside].astype(np.uint8)))
+
+    def build_reference(self):
+        """
+        Merakit model dengan loop per voxel (implementasi asli, lambat)
+        
+        Disimpan untuk memverifikasi bahwa build() menghasilkan grid yang identik.
+        """
         print("Merakit model Space Shuttle realistis... Mohon tunggu sebentar.")
         
+        # Grid dense sementara, dikonversi ke VoxelSet di akhir build
+        self.voxel = np.zeros((self.row, self.col, self.length, 3), dtype=np.uint8)
+        
         # Shortcut variable untuk local scope agar kode asli tetap jalan rapi
         cx, cy, cz = self.cx, self.cy, self.cz
         
@@ -256,11 +392,250 @@ class RocketModel:
             for x in range(cx+45, cx+65):
                 if (x+y)%3 > 0: self.set_vox(y,x,cz_orb-2, self.C_BLACK_LIT)
 
+        return self._finish_build()
+
+    def _finish_build(self):
+        """Konversi grid dense (build_reference) atau tulisan sparse (build) ke VoxelSet + kulit model"""
+        shape = (self.row, self.col, self.length)
+        if self.voxel is not None:
+            self.voxels = VoxelSet.from_dense(self.voxel)
+        else:
+            self.voxels = VoxelSet.from_writes(self._writes, shape)
+        self.voxel = None
+        self._writes = []
+        
+        # Precompute kulit model: voxel dalam tidak pernah lolos depth test
+        self.surface_voxels = self.voxels.surface()
+        
         print("Model Rocket Selesai Dibangun!")
-        return self.voxel
+        return self.voxels
+
+    def _row_profile(self, y_range, fn):
+        """Hitung nilai per baris y dengan ekspresi skalar yang sama seperti loop asli"""
+        return np.array([fn(y) for y in y_range], dtype=float)
+
+    def build(self):
+        """
+        Fungsi utama untuk merakit model (vectorized per komponen)
+        
+        Setiap komponen dibuat dengan grid koordinat broadcast, boolean mask dan
+        shading vectorized. Komponen dicatat berurutan seperti build_reference()
+        sehingga voxel yang tumpang tindih ditimpa dengan urutan yang sama.
+        Grid dense (row, col, length, 3) tidak pernah dibuat.
+        """
+        print("Merakit model Space Shuttle realistis... Mohon tunggu sebentar.")
+        
+        # Tulisan sparse per komponen, digabung ke VoxelSet di akhir build
+        self.voxel = None
+        self._writes = []
+        
+        cx, cy, cz = self.cx, self.cy, self.cz
+        
+        # --- 1. EXTERNAL TANK (ET) ---
+        h_et = 280; r_et = 40
+        y_et = cy - h_et//2 + 25
+        cz_et = cz + 30
+        
+        y_range = range(int(y_et), int(y_et+h_et+10))
+        radius = self._row_profile(
+            y_range, lambda y: r_et if y < y_et + h_et - 50 else r_et * (1 - ((y-(y_et+h_et-50))/60)**0.8))
+        y, x, z, r = self._solid_of_revolution(y_range, radius, cx, cz_et)
+        
+        nx = (x - cx) / r
+        nz = (z - cz_et) / r
+        ny = np.where(y > y_et+h_et-50, 0.2, 0.0)
+        colors = self.get_color_shaded_many(nx, ny, nz, self.C_ORANGE_LIT, self.C_ORANGE_DARK)
+        
+        # Tekstur Foam & Garis Detail
+        dark_line = ((z - cz_et) % 20 < 2) & (np.abs(x-cx) < r*0.8)
+        foam = ~dark_line & (((x+y+z) % 7 == 0) | ((x*y) % 13 == 0))
+        colors[dark_line] = self.C_ORANGE_DARK
+        colors[foam] = self.C_ORANGE_MID
+        self.set_vox_many(y, x, z, colors)
+        
+        # --- 2. SOLID ROCKET BOOSTERS (SRB) ---
+        h_srb = 250; r_srb = 18
+        y_srb = y_et + 15
+        dist_srb = r_et + r_srb + 10
+        
+        def srb_radius(y):
+            if y < y_srb-10: return r_srb - 4
+            elif y < y_srb: return r_srb + 3
+            elif y < y_srb+h_srb-40: return r_srb
+            else: return r_srb * (1 - ((y-(y_srb+h_srb-40))/60))
+        
+        def srb_palette(y):
+            if y < y_srb-10:
+                return self.C_GREY_NOZZLE, [60,60,60]
+            elif y < y_srb and (y//4)%2==0:
+                return self.C_BLACK_LIT, self.C_BLACK_SHADE
+            elif (y - y_srb) % 60 < 3 and 0 < y-y_srb < h_srb-50:
+                return self.C_BLACK_LIT, self.C_BLACK_SHADE
+            return self.C_WHITE_LIT, self.C_WHITE_SHADE
+        
+        y_range = range(int(y_srb-40), int(y_srb+h_srb+20))
+        radius = self._row_profile(y_range, srb_radius)
+        palette = np.array([srb_palette(y) for y in y_range])  # (rows, 2, 3)
+        
+        for side in [-1, 1]:
+            cx_s = cx + side * dist_srb
+            y, x, z, r, row = self._solid_of_revolution(y_range, radius, cx_s, cz_et, return_rows=True)
+            
+            nx = (x - cx_s) / r
+            nz = (z - cz_et) / r
+            ny = np.where(y > y_srb+h_srb-40, 0.3, np.where(y < y_srb, 0.1, 0.0))
+            colors = self.get_color_shaded_many(nx, ny, nz, palette[row, 0], palette[row, 1])
+            self.set_vox_many(y, x, z, colors)
+        
+        # --- 3. ORBITER (PESAWAT ULANG ALIK) ---
+        h_orb = 180; r_orb = 25
+        y_orb = y_et + 35
+        cz_orb = cz - 35
+        
+        # A. Badan (Fuselage) & Hidung
+        y_range = range(int(y_orb), int(y_orb+h_orb+25))
+        radius = self._row_profile(
+            y_range, lambda y: r_orb if y < y_orb+h_orb-30 else r_orb * (1 - ((y-(y_orb+h_orb-30))/55)**0.9))
+        y, x, z, r = self._solid_of_revolution(y_range, radius, cx, cz_orb)
+        
+        nx = (x - cx) / r
+        nz = (z - cz_orb) / r
+        ny = np.where(y > y_orb+h_orb-30, 0.2, 0.0)
+        
+        is_black = ((z < cz_orb) & (np.abs(x-cx) < r_orb*0.8)) | (y > y_orb+h_orb-10) | (z < cz_orb - r_orb + 5)
+        c_lit = np.where(is_black[:, None], self.C_BLACK_LIT, self.C_WHITE_LIT)
+        c_shade = np.where(is_black[:, None], self.C_BLACK_SHADE, self.C_WHITE_SHADE)
+        self.set_vox_many(y, x, z, self.get_color_shaded_many(nx, ny, nz, c_lit, c_shade))
+        
+        # B. Detail Kokpit & Jendela
+        y_cock = y_orb + h_orb - 30
+        z_front = cz_orb - r_orb + 3
+        y, x = np.meshgrid(np.arange(int(y_cock), int(y_cock+12)), np.arange(cx-14, cx+14), indexing='ij')
+        y, x = y.ravel(), x.ravel()
+        
+        window = (np.abs(x-cx) < 6) & (y > y_cock+3)
+        glint = window & (x > cx+2) & (y > y_cock+8)
+        colors = np.where(glint[:, None], self.C_WINDOW_GLINT, self.C_BLACK_LIT)
+        self.set_vox_many(y[window], x[window], z_front, colors[window])
+        
+        side_panel = ~window & (7 < np.abs(x-cx)) & (np.abs(x-cx) < 12) & (y < y_cock+7)
+        nx = np.where(x[side_panel] > cx, 0.8, -0.8)
+        colors = self.get_color_shaded_many(nx, 0.2, -0.3, self.C_BLACK_LIT, self.C_BLACK_SHADE)
+        self.set_vox_many(y[side_panel], x[side_panel], z_front+3, colors)
+        
+        # C. Sayap Delta
+        y_w_start = y_orb + 5; y_w_end = y_orb + 120
+        span_max = 105
+        y_range = range(int(y_w_start), int(y_w_end))
+        rel_y = self._row_profile(y_range, lambda y: (y_w_end - y) / (y_w_end - y_w_start))
+        curr_span = r_orb + (span_max - r_orb) * rel_y
+        z_lead = cz_orb - r_orb + (r_orb * rel_y * 1.2)
+        z_thick = z_lead + 6
+        
+        x_start = (cx - curr_span).astype(np.int64)
+        x_end = (cx + curr_span).astype(np.int64)
+        z_start = z_lead.astype(np.int64)
+        z_end = int(cz_orb+r_orb-2)
+        
+        Y = np.arange(int(y_w_start), int(y_w_end))[:, None, None]
+        X = np.arange(x_start.min(), x_end.max())[None, :, None]
+        Z = np.arange(z_start.min(), z_end)[None, None, :]
+        footprint = ((X >= x_start[:, None, None]) & (X < x_end[:, None, None]) &
+                     ~(np.abs(X-cx) < r_orb*0.9) &
+                     (Z >= z_start[:, None, None]) & (Z < z_end))
+        row, ix, iz = np.nonzero(footprint)
+        y, x, z = Y.ravel()[row], X.ravel()[ix], Z.ravel()[iz]
+        
+        is_black = (z < z_thick[row]) | (z > cz_orb - 5)  # leading edge / underside
+        c_lit = np.where(is_black[:, None], self.C_BLACK_LIT, self.C_WHITE_LIT)
+        c_shade = np.where(is_black[:, None], self.C_BLACK_SHADE, self.C_WHITE_SHADE)
+        colors = self.get_color_shaded_many(0, 0.1, 0.9, c_lit, c_shade)
+        colors[is_black & ((x+y+z) % 4 == 0)] = self.C_BLACK_LIT
+        
+        # Loop asli menulis baris y lalu baris y-1 (hitam); baris y-1 selalu
+        # ditulis setelah warnanya sendiri, jadi lapisan hitam menang
+        self.set_vox_many(y, x, z, colors)
+        self.set_vox_many(y-1, x, z, self.C_BLACK_SHADE)
+        
+        # D. Ekor Vertikal & Mesin OMS
+        y_range = range(int(y_w_end-35), int(y_w_end+25))
+        rel_y = self._row_profile(y_range, lambda y: (y - (y_w_end-35))/60)
+        z_pos = cz_orb + r_orb - 8 + (25*rel_y)
+        h_tail = 60 * (1-rel_y*0.3)
+        z_start = z_pos.astype(np.int64)
+        z_end = (z_pos + h_tail).astype(np.int64)
+        
+        Y = np.arange(int(y_w_end-35), int(y_w_end+25))[:, None, None]
+        X = np.arange(cx-3, cx+4)[None, :, None]
+        Z = np.arange(z_start.min(), z_end.max())[None, None, :]
+        fin = np.broadcast_to((Z >= z_start[:, None, None]) & (Z < z_end[:, None, None]),
+                              (Y.size, X.size, Z.size))
+        row, ix, iz = np.nonzero(fin)
+        y, x, z = Y.ravel()[row], X.ravel()[ix], Z.ravel()[iz]
+        
+        is_edge = z < z_pos[row]+4
+        c_lit = np.where(is_edge[:, None], self.C_BLACK_LIT, self.C_WHITE_LIT)
+        c_shade = np.where(is_edge[:, None], self.C_BLACK_SHADE, self.C_WHITE_SHADE)
+        nx = np.where(x > cx, 0.9, -0.9)
+        self.set_vox_many(y, x, z, self.get_color_shaded_many(nx, 0, 0, c_lit, c_shade))
+        
+        # Mesin OMS
+        for x_side in [-1, 1]:
+            cx_oms = cx + x_side*10
+            Y = np.arange(int(y_w_end-20), int(y_w_end))[:, None, None]
+            X = np.arange(cx_oms - 6, cx_oms + 7)[None, :, None]
+            Z = np.arange(int(cz_orb+r_orb-10), int(cz_orb+r_orb+5))[None, None, :]
+            nozzle = np.broadcast_to(np.sqrt((X-cx_oms)**2 + (Z-(cz_orb+r_orb))**2) < 8,
+                                     (Y.size, X.size, Z.size))
+            row, ix, iz = np.nonzero(nozzle)
+            self.set_vox_many(Y.ravel()[row], X.ravel()[ix], Z.ravel()[iz], self.C_WHITE_SHADE)
+        
+        # E. Logo & Tulisan
+        y, x = np.meshgrid(np.arange(int(y_w_start+50), int(y_w_start+60)), np.arange(cx-55, cx-45), indexing='ij')
+        self.set_vox_many(y.ravel(), x.ravel(), cz_orb-2, self.C_BLUE_NASA)
+        y, x = np.meshgrid(np.arange(int(y_w_start+50), int(y_w_start+55)), np.arange(cx+45, cx+65), indexing='ij')
+        text = (x+y) % 3 > 0
+        self.set_vox_many(y[text], x[text], cz_orb-2, self.C_BLACK_LIT)
+        
+        return self._finish_build()
+
+    def _solid_of_revolution(self, y_range, radius, center_x, center_z, return_rows=False):
+        """
+        Voxel tabung vertikal: sel (y, x, z) dengan jarak ke sumbu <= radius[y]
+        
+        Returns: (y, x, z, r) array per voxel (+ index baris jika return_rows)
+        """
+        r_max = radius.max()
+        Y = np.arange(y_range.start, y_range.stop)
+        X = np.arange(int(center_x-r_max-1), int(center_x+r_max+2))[:, None]
+        Z = np.arange(int(center_z-r_max-1), int(center_z+r_max+2))[None, :]
+        dist = np.sqrt((X-center_x)**2 + (Z-center_z)**2)
+        
+        row, ix, iz = np.nonzero(dist[None, :, :] <= radius[:, None, None])
+        result = (Y[row], X.ravel()[ix], Z.ravel()[iz], radius[row])
+        return result + (row,) if return_rows else result
+
+def load_or_build(col=320, row=450, length=320):
+    """
+    Load model dari cache; jika belum ada, build sekali lalu simpan ke cache
+
+    Dipakai bersama oleh render (main.py) dan preview (Visualizer) sehingga
+    keduanya berbagi cache yang sama, termasuk piramida LOD dan brick index.
+    Returns: (cache_data dari RocketModel.load_cache, sumber "cache"/"build")
+    """
+    cache_data = RocketModel.load_cache(col, row, length)
+    if cache_data is not None:
+        return cache_data, "cache"
+    rocket = RocketModel(col=col, row=row, length=length)
+    rocket.build()
+    rocket.save_cache()
+    cache_data = RocketModel.load_cache(col, row, length)
+    if cache_data is None:
+        raise RuntimeError(f"Model cache could not be loaded from {CACHE_DIR}")
+    return cache_data, "build"
 
 # Cara penggunaan (opsional, agar bisa langsung ditest run)
 if __name__ == "__main__":
     model = RocketModel()
     voxels = model.build()
-    print(f"Shape akhir voxel: {voxels.shape}")
\ No newline at end of file
+    print(f"Jumlah voxel: {len(voxels)} ({voxels.nbytes / 1e6:.1f} MB)")
\ No newline at end of file
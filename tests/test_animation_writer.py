@@ -0,0 +1,63 @@
+"""
+Test - GifWriter memakai satu palette tetap yang mencakup warna semua frame
+
+Frame dengan warna berbeda (termasuk frame pertama hitam polos) harus
+ter-decode ke warna kubus terdekat masing-masing, bukan ke warna frame pertama.
+Jalankan dari root project:
+    python -m pytest -q tests
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation_writer import GifWriter
+
+Image = pytest.importorskip("PIL.Image")
+
+# Setengah jarak antar level kubus 6x7x6 (255/5/2 untuk merah dan biru)
+MAX_ERROR = 26
+
+
+def decode_frames(path):
+    with Image.open(path) as image:
+        frames = []
+        for index in range(image.n_frames):
+            image.seek(index)
+            frames.append(np.array(image.convert("RGB")))
+    return frames
+
+
+def write_gif(path, frames):
+    with GifWriter(path) as writer:
+        for frame in frames:
+            writer.write(frame)
+
+
+def test_solid_frames_keep_their_colors(tmp_path):
+    colors = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]
+    frames = [np.full((12, 16, 3), color, dtype=np.uint8) for color in colors]
+    path = str(tmp_path / "solid.gif")
+    write_gif(path, frames)
+
+    decoded = decode_frames(path)
+    assert len(decoded) == len(colors)
+    for frame, color in zip(decoded, colors):
+        assert np.array_equal(frame, np.broadcast_to(color, frame.shape))
+
+
+def test_later_frame_colors_are_close(tmp_path):
+    rng = np.random.default_rng(0)
+    frames = [np.zeros((24, 32, 3), dtype=np.uint8)]
+    frames += [rng.integers(0, 256, (24, 32, 3), dtype=np.uint8) for _ in range(3)]
+    path = str(tmp_path / "noise.gif")
+    write_gif(path, frames)
+
+    decoded = decode_frames(path)
+    assert len(decoded) == len(frames)
+    for frame, expected in zip(decoded, frames):
+        error = np.abs(frame.astype(np.int16) - expected.astype(np.int16))
+        assert error.max() <= MAX_ERROR
@@ -0,0 +1,59 @@
+"""
+Test - RocketModel.build (vectorized) harus byte-identik dengan build_reference (loop per voxel)
+
+Grid dipendekkan (row, length) agar build cepat, tapi col tetap 250 agar
+SRB (pusat di cx +- 68) dan ujung sayap ikut terbangun; baris 0-9 berisi
+nozzle dan pita gelap SRB. Kedua builder melakukan bounds-check, sehingga
+bagian model di luar grid terpotong dengan cara yang sama.
+Jalankan dari root project:
+    python -m pytest -q tests
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rocket_model import RocketModel
+
+
+# (col, row, length): lebar penuh untuk SRB dan sayap, tinggi/panjang dipotong
+DIMENSIONS = (250, 240, 128)
+
+
+@pytest.fixture(scope="module")
+def models():
+    vectorized = RocketModel(*DIMENSIONS)
+    vectorized.build()
+    reference = RocketModel(*DIMENSIONS)
+    reference.build_reference()
+    return vectorized, reference
+
+
+def test_build_matches_reference_grid(models):
+    vectorized, reference = models
+    dense = vectorized.voxels.to_dense()
+    expected = reference.voxels.to_dense()
+    assert dense.shape == (DIMENSIONS[1], DIMENSIONS[0], DIMENSIONS[2], 3)
+    assert dense.any()
+    assert dense.dtype == expected.dtype
+    assert dense.tobytes() == expected.tobytes()
+
+
+def test_grid_covers_srb_nozzles(models):
+    vectorized, _ = models
+    voxels = vectorized.voxels
+    offset = voxels.x.astype(np.int64) - vectorized.cx
+    # Di bawah baris 10 hanya nozzle/pita SRB yang berada jauh dari ET (r=40)
+    nozzle = voxels.y < 10
+    assert np.any(nozzle & (offset < -50))
+    assert np.any(nozzle & (offset > 50))
+
+
+def test_build_matches_reference_voxel_order(models):
+    vectorized, reference = models
+    for name in ("y", "x", "z", "colors"):
+        assert np.array_equal(getattr(vectorized.voxels, name), getattr(reference.voxels, name))
+    assert len(vectorized.surface_voxels) == len(reference.surface_voxels)
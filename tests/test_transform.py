@@ -0,0 +1,77 @@
+"""
+Test - API batch (Transform.transform_points, Camera.world_to_camera_many)
+harus sama dengan versi skalar transform_point / world_to_camera
+
+Renderer memakai matriks gabungan get_view_matrix() @ get_matrix(); itu juga
+dibandingkan dengan rantai skalar.
+Jalankan dari root project:
+    python -m pytest -q tests
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transform import Transform
+from camera import Camera
+
+CENTROID = (160.0, 225.0, 160.0)
+POSES = [
+    # (yaw, pitch, roll, translation, scale)
+    (0.0, 0.0, 0.0, (0.0, 0.0, 0.0), 1.0),
+    (30.0, -15.0, 0.0, (12.5, -4.0, 7.0), 1.0),
+    (210.0, 75.0, 40.0, (-30.0, 18.0, -9.5), 1.7),
+]
+CAMERAS = [
+    # (position relatif centroid, rotation)
+    ((0.0, 0.0, -300.0), {"x": 0.0, "y": 0.0, "z": 0.0}),
+    ((80.0, -40.0, -250.0), {"x": 10.0, "y": -25.0, "z": 5.0}),
+    ((0.0, 400.0, 0.0), {"x": 0.0, "y": 0.0, "z": 0.0}),
+]
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(0)
+    return rng.uniform(0, 320, (200, 3))
+
+
+def make_transform(yaw, pitch, roll, translation, scale):
+    transform = Transform()
+    transform.set_rotation_degrees(yaw=yaw, pitch=pitch, roll=roll)
+    transform.set_translation(*translation)
+    transform.set_scale(scale)
+    return transform
+
+
+def make_camera(offset, rotation):
+    position = np.add(CENTROID, offset)
+    return Camera(position, CENTROID, rotation)
+
+
+@pytest.mark.parametrize("pose", POSES)
+def test_transform_points_matches_transform_point(points, pose):
+    transform = make_transform(*pose)
+    expected = np.array([transform.transform_point(*p, *CENTROID) for p in points])
+    np.testing.assert_allclose(transform.transform_points(points, *CENTROID), expected, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("offset, rotation", CAMERAS)
+def test_world_to_camera_many_matches_world_to_camera(points, offset, rotation):
+    camera = make_camera(offset, rotation)
+    expected = np.array([camera.world_to_camera(*p) for p in points])
+    np.testing.assert_allclose(camera.world_to_camera_many(points), expected, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("pose", POSES)
+@pytest.mark.parametrize("offset, rotation", CAMERAS)
+def test_model_view_matrix_matches_scalar_chain(points, pose, offset, rotation):
+    transform = make_transform(*pose)
+    camera = make_camera(offset, rotation)
+    model_view = camera.get_view_matrix() @ transform.get_matrix(*CENTROID)
+    expected = np.array([camera.world_to_camera(*transform.transform_point(*p, *CENTROID)) for p in points])
+    result = points @ model_view[:3, :3].T + model_view[:3, 3]
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9)
@@ -0,0 +1,105 @@
+#ini file timeline.py
+"""
+Timeline - Interpolasi keyframe animasi objek & kamera menjadi N frame
+Semua frame disampling sekaligus sebagai array (bukan loop per frame)
+"""
+import numpy as np
+
+
+INTERPOLATION_MODES = ("linear", "smooth")
+
+
+def frame_times(total_frames):
+    """Waktu normalisasi [0, 1] untuk setiap frame (frame pertama & terakhir tepat di keyframe ujung)"""
+    if total_frames <= 1:
+        return np.zeros(max(0, total_frames))
+    return np.linspace(0.0, 1.0, total_frames)
+
+
+def unwrap_degrees(angles):
+    """Buat keyframe sudut kontinu agar interpolasi mengambil busur terpendek (350° -> 10° lewat 360°)"""
+    angles = np.asarray(angles, dtype=np.float64)
+    return np.degrees(np.unwrap(np.radians(angles), axis=0))
+
+
+def interpolate(keys, t, mode="linear"):
+    """
+    Interpolasi keyframe yang berjarak sama pada waktu t
+
+    Args:
+        keys: array (K,) atau (K, D) nilai keyframe
+        t: array (N,) waktu normalisasi [0, 1]
+        mode: 'linear' atau 'smooth' (Catmull-Rom uniform, melewati semua keyframe)
+
+    Returns:
+        array (N,) atau (N, D)
+    """
+    if mode not in INTERPOLATION_MODES:
+        raise ValueError(f"Unknown interpolation mode: {mode!r} (expected one of {INTERPOLATION_MODES})")
+
+    keys = np.asarray(keys, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    count = len(keys)
+    if count == 0:
+        raise ValueError("At least one keyframe is required")
+    if count == 1:
+        return np.repeat(keys[:1], len(t), axis=0)
+
+    # Segmen keyframe dan posisi lokal s di dalam segmen
+    u = np.clip(t, 0.0, 1.0) * (count - 1)
+    segment = np.minimum(u.astype(np.int64), count - 2)
+    s = u - segment
+    if keys.ndim > 1:
+        s = s[:, None]
+
+    p1 = keys[segment]
+    p2 = keys[segment + 1]
+    if mode == "linear":
+        return p1 + (p2 - p1) * s
+
+    # Catmull-Rom: keyframe ujung diduplikasi sebagai titik kontrol luar
+    p0 = keys[np.maximum(segment - 1, 0)]
+    p3 = keys[np.minimum(segment + 2, count - 1)]
+    s2 = s * s
+    s3 = s2 * s
+    return 0.5 * (2.0 * p1
+                  + (p2 - p0) * s
+                  + (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3) * s2
+                  + (3.0 * p1 - p0 - 3.0 * p2 + p3) * s3)
+
+
+def sample_track(points, t, mode="linear"):
+    """
+    Sampling satu track animasi (list animation point config) pada waktu t
+
+    Posisi memakai mode yang dipilih; pitch/yaw di-unwrap dulu lalu memakai
+    mode yang sama, sehingga rotasi selalu mengambil arah terpendek.
+
+    Returns:
+        (positions (N, 3), pitch (N,), yaw (N,))
+    """
+    positions = np.array([p["translation"]["position"] for p in points], dtype=np.float64)
+    angles = np.array([[p["rotation"].get("pitch", 0.0), p["rotation"].get("yaw", 0.0)] for p in points],
+                      dtype=np.float64)
+    sampled_angles = interpolate(unwrap_degrees(angles), t, mode)
+    return interpolate(positions, t, mode), sampled_angles[:, 0], sampled_angles[:, 1]
+
+
+def build_jobs(object_points, camera_points, total_frames, mode="linear"):
+    """
+    Buat daftar frame job untuk frame_renderer dari keyframe objek & kamera
+
+    Kedua track direntangkan di sepanjang seluruh animasi: keyframe pertama
+    di frame 0, keyframe terakhir di frame total_frames - 1.
+    """
+    t = frame_times(total_frames)
+    obj_pos, obj_pitch, obj_yaw = sample_track(object_points, t, mode)
+    cam_pos, cam_pitch, cam_yaw = sample_track(camera_points, t, mode)
+
+    return [{
+        "index": i,
+        "translation": obj_pos[i].tolist(),
+        "rotation": {"pitch": float(obj_pitch[i]), "yaw": float(obj_yaw[i])},
+        "cam_trans": cam_pos[i].tolist(),
+        "cam_rot": {"pitch": float(cam_pitch[i]), "yaw": float(cam_yaw[i])}
+    } for i in range(total_frames)]
@@ -90,3 +90,51 @@ class Transform:
         world_z = centroid_z + z_rot + self.tz
         
         return world_x, world_y, world_z
+    
+    def get_rotation_matrix(self):
+        """
+        Matriks rotasi 3x3 yang ekuivalen dengan apply_rotation (Roll @ Pitch @ Yaw)
+        """
+        cos_yaw, sin_yaw = np.cos(self.yaw), np.sin(self.yaw)
+        cos_pitch, sin_pitch = np.cos(self.pitch), np.sin(self.pitch)
+        cos_roll, sin_roll = np.cos(self.roll), np.sin(self.roll)
+        
+        Ry = np.array([[cos_yaw, 0, sin_yaw],
+                       [0, 1, 0],
+                       [-sin_yaw, 0, cos_yaw]])
+        Rx = np.array([[1, 0, 0],
+                       [0, cos_pitch, -sin_pitch],
+                       [0, sin_pitch, cos_pitch]])
+        Rz = np.array([[cos_roll, -sin_roll, 0],
+                       [sin_roll, cos_roll, 0],
+                       [0, 0, 1]])
+        return Rz @ Rx @ Ry
+    
+    def get_matrix(self, centroid_x, centroid_y, centroid_z):
+        """
+        Matriks affine 4x4 untuk Scale → Rotation around centroid → Translation
+        
+        Dihitung sekali per pose, sehingga world = M @ [x, y, z, 1]
+        """
+        centroid = np.array([centroid_x, centroid_y, centroid_z], dtype=float)
+        linear = self.scale * self.get_rotation_matrix()
+        offset = centroid + np.array([self.tx, self.ty, self.tz], dtype=float) - linear @ centroid
+        
+        matrix = np.eye(4)
+        matrix[:3, :3] = linear
+        matrix[:3, 3] = offset
+        return matrix
+    
+    def transform_points(self, points, centroid_x, centroid_y, centroid_z):
+        """
+        Versi batch dari transform_point
+        
+        Args:
+            points: array (N, 3) koordinat (x, y, z)
+        
+        Returns:
+            array (N, 3) koordinat world
+        """
+        matrix = self.get_matrix(centroid_x, centroid_y, centroid_z)
+        points = np.asarray(points, dtype=float)
+        return points @ matrix[:3, :3].T + matrix[:3, 3]
@@ -1,17 +1,39 @@
 #ini file visualizer.py
+import os
 import matplotlib
-matplotlib.use('TkAgg')
+# Backend dari MPLBACKEND (mis. Agg untuk benchmark headless) dihormati; default TkAgg
+if not os.environ.get("MPLBACKEND"):
+    matplotlib.use('TkAgg')
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from typing import List, Optional, Dict
-from rocket_model import RocketModel
+from rocket_model import load_or_build
 from transform import Transform
 
 class Visualizer:
-    """Handles visualization with real rocket model rendering"""
+    """
+    Handles visualization with real rocket model rendering
     
-    def __init__(self):
+    Retained mode: semua artist (scatter rocket, kamera, path, label, image
+    Camera POV) dibuat sekali per figure lalu diperbarui di tempat. Jika
+    backend mendukung, update digambar dengan blitting di atas background
+    statis (grid, axis, pane) yang disimpan setiap kali figure digambar penuh.
+    """
+    
+    # Blitting dipakai jika canvas mendukung (copy_from_bbox/restore_region)
+    use_blit = True
+    # Level LOD (dari cache) untuk scatter rocket di scene 3D dan untuk Camera POV
+    # quality="fast"; quality lain memakai voxel penuh
+    preview_lod = 4
+    camera_view_lod = 2
+    
+    def __init__(self, surface_only: bool = True, load: bool = True):
+        """
+        load=False: figure bisa langsung dibuat (placeholder), model di-load
+        belakangan dengan load_model(), misalnya dari thread worker GUI.
+        """
         plt.ion()
         self.fig = None
         self.ax_scene = None
@@ -21,29 +43,162 @@ class Visualizer:
         self.camera_rotation = {"x": 0.0, "y": 0.0}  # x=pitch, y=yaw
         self.fov = 60
         
-        # Build rocket model once
-        self.rocket_model = RocketModel(col=320, row=450, length=320)
-        self.voxel_data = self.rocket_model.build()
-        self.rocket_centroid = self.rocket_model.get_centroid()
-        
-        self._cached_indices = None
-        self._cache_voxel_indices()
+        self.surface_only = surface_only
+        self.voxels = None
+        self.rocket_centroid = np.zeros(3)
+        empty_points, empty_colors = np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.uint8)
+        self._scene_points, self._scene_colors = empty_points, empty_colors
+        # Titik Camera POV per quality: (points, colors, scale)
+        self._camera_sets = {}
+        # Naik di setiap show_* sinkron; hasil worker dengan generation lama dibuang
+        self.generation = 0
+        
+        # Artist retained mode (dibuat di _ensure_figure) dan state blitting
+        self._artists = {}
+        self._labels = []
+        self._limit = None
+        self._background = None
+        self._blit = False
+        
+        if load:
+            self.load_model()
+    
+    @property
+    def ready(self):
+        """True jika model sudah di-load (sebelum itu preview menampilkan placeholder)"""
+        return self.voxels is not None
+    
+    def load_model(self):
+        """
+        Load model dari cache yang sama dengan render (memory-mapped); build hanya jika cache belum ada
+        
+        Hanya NumPy (tanpa matplotlib), aman dijalankan di thread worker.
+        Semua array disiapkan dulu, self.voxels di-set terakhir sehingga
+        ready baru True saat data lengkap.
+        """
+        cache_data, _ = load_or_build()
+        # Preview cukup memakai kulit model (voxel dalam tidak terlihat)
+        voxels = cache_data["surface"] if self.surface_only else cache_data["voxels"]
+        self._cache_voxel_indices(voxels)
+        self.rocket_centroid = cache_data["centroid"]
+        self.voxels = voxels
+        return self
+    
+    def _cache_voxel_indices(self, voxels):
+        """
+        Cache titik & warna voxel: scene 3D dari level LOD preview (sudah ada di
+        cache), Camera POV dari level camera_view_lod (fast) dan semua voxel aktif
+        """
+        self._scene_points, self._scene_colors = self._voxel_points(self._lod_level(voxels, self.preview_lod))
+        fast = self._lod_level(voxels, self.camera_view_lod)
+        self._camera_sets = {
+            "fast": self._voxel_points(fast) + (fast.scale,),
+            "full": self._voxel_points(voxels) + (voxels.scale,)
+        }
     
-    def _cache_voxel_indices(self):
-        """Cache voxel indices for faster rendering"""
-        y_i, x_i, z_i = np.where(np.sum(self.voxel_data, axis=3) > 10)
-        self._cached_indices = (y_i, x_i, z_i)
+    @staticmethod
+    def _lod_level(voxels, factor):
+        """Level LOD factor dari cache, atau voxel penuh jika level itu tidak ada"""
+        return voxels.lod(factor) if factor in voxels.lods else voxels
+    
+    @staticmethod
+    def _voxel_points(voxels):
+        """
+        Titik tengah voxel aktif (x, y, z) float32 dalam koordinat model asli + warna
+        
+        Voxel level LOD berukuran scale voxel asli, titik tengahnya di
+        koordinat * scale + (scale - 1) / 2.
+        """
+        active = voxels.active(10)
+        points = np.column_stack((active.x, active.y, active.z)).astype(np.float32)
+        if active.scale > 1:
+            points = points * active.scale + (active.scale - 1) / 2
+        return points, np.array(active.colors)
     
     def _ensure_figure(self):
-        """Ensure dual figure exists: 3D scene (left) + 2D camera POV (right)"""
-        if self.fig is None or not plt.fignum_exists(self.fig.number):
-            self.fig = plt.figure(figsize=(14, 6))
-            self.ax_scene = self.fig.add_subplot(121, projection='3d')
-            self.ax_camera = self.fig.add_subplot(122)
-            self.fig.tight_layout(pad=3.0)
+        """Ensure dual figure exists: 3D scene (left) + 2D camera POV (right), artist dibuat sekali"""
+        if self.fig is not None and plt.fignum_exists(self.fig.number):
+            return
+        self.fig = plt.figure(figsize=(14, 6))
+        self.ax_scene = self.fig.add_subplot(121, projection='3d')
+        self.ax_camera = self.fig.add_subplot(122)
+        self.fig.tight_layout(pad=3.0)
+        self._limit = None
+        self._background = None
+        self._labels = []
+        
+        self._add_grid_3d(self.ax_scene, 50)
+        ax = self.ax_camera
+        ax.set_facecolor('white')
+        ax.set_xlim([-2, 2])
+        ax.set_ylim([-1.5, 1.5])
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.3)
+        ax.set_xlabel('X')
+        ax.set_ylabel('Y')
+        
+        scene = self.ax_scene
+        empty = np.zeros(0)
+        extent = self.camera_view_extent
+        self._artists = {
+            "rockets": scene.scatter(empty, empty, empty, s=8, marker='s', alpha=0.9,
+                                     edgecolors='none', depthshade=True),
+            "waypoints": scene.scatter(empty, empty, empty, s=100, marker='o', alpha=0.8,
+                                       edgecolors='white', linewidths=2),
+            "current": scene.scatter(empty, empty, empty, c='orange', s=150, marker='*', alpha=1.0,
+                                     edgecolors='white', linewidths=2),
+            "object_path": scene.plot([], [], [], 'k-', linewidth=2, alpha=0.5)[0],
+            "camera_path": scene.plot([], [], [], 'purple', linewidth=2, alpha=0.6, linestyle='--')[0],
+            "camera_sphere": scene.add_collection3d(Poly3DCollection([], color='purple', alpha=0.8)),
+            "camera_arrow": scene.quiver(0, 0, 0, 0, 0, 1, color='cyan', arrow_length_ratio=0.15, linewidth=3),
+            "camera_x1": scene.plot([], [], [], color='yellow', linewidth=6, alpha=1.0)[0],
+            "camera_x2": scene.plot([], [], [], color='yellow', linewidth=6, alpha=1.0)[0],
+            "camera_label": scene.text(0, 0, 0, '', fontsize=7, fontweight='bold', color='purple', ha='center'),
+            "scene_title": scene.set_title('', fontsize=10),
+            "camera_image": ax.imshow(np.zeros((1, 1, 4)), extent=(-extent, extent, -extent, extent),
+                                      origin='lower', interpolation='nearest', zorder=2),
+            "no_object": ax.text(0, 0, 'No object in view', ha='center', va='center',
+                                 fontsize=12, color='gray', style='italic', visible=False),
+            "camera_title": ax.set_title('', fontsize=9)
+        }
+        
+        canvas = self.fig.canvas
+        self._blit = self.use_blit and canvas.supports_blit
+        if self._blit:
+            for artist in self._artists.values():
+                artist.set_animated(True)
+            canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _dynamic_artists(self):
+        return list(self._artists.values()) + self._labels
+    
+    def _on_draw(self, event):
+        """Setelah figure digambar penuh: simpan background statis lalu gambar artist animated"""
+        if event is not None and event.canvas is not self.fig.canvas:
+            return
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        for artist in self._dynamic_artists():
+            if not artist.get_visible():
+                continue
+            # Artist 3D diproyeksikan dengan matriks view dari draw penuh terakhir
+            if hasattr(artist, "do_3d_projection"):
+                artist.do_3d_projection()
+            artist.axes.draw_artist(artist)
+    
+    def _present(self):
+        """Tampilkan update: blit di atas background tersimpan, atau draw penuh"""
+        canvas = self.fig.canvas
+        if self._blit and self._background is not None and not self.fig.stale:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+            canvas.blit(self.fig.bbox)
         else:
-            self.ax_scene.clear()
-            self.ax_camera.clear()
+            # Draw penuh (juga memicu _on_draw untuk menyimpan background baru)
+            canvas.draw()
+        canvas.flush_events()
     
     def set_camera_position(self, x: float, y: float, z: float):
         self.camera_position = np.array([x, y, z])
@@ -57,15 +212,22 @@ class Visualizer:
         ax.set_ylabel('Y', fontsize=10, color='green')
         ax.set_zlabel('Z', fontsize=10, color='blue')
         ax.grid(True, alpha=0.3, linestyle='-')
-        
-        ax.set_xlim([-limit, limit])
-        ax.set_ylim([-limit, limit])
-        ax.set_zlim([-limit, limit])
+        self._set_scene_limit(limit)
+    
+    def _set_scene_limit(self, limit):
+        """Ubah batas axis 3D hanya jika berbeda (perubahan memicu draw penuh)"""
+        if limit == self._limit:
+            return
+        self._limit = limit
+        self.ax_scene.set_xlim([-limit, limit])
+        self.ax_scene.set_ylim([-limit, limit])
+        self.ax_scene.set_zlim([-limit, limit])
     
-    def _get_camera_view_direction(self):
-        """Calculate camera view direction based on pitch and yaw rotation"""
-        pitch = np.radians(self.camera_rotation['x'])  # rotation around X axis
-        yaw = np.radians(self.camera_rotation['y'])    # rotation around Y axis
+    def _get_camera_view_direction(self, camera_rotation: Optional[Dict] = None):
+        """Calculate camera view direction based on pitch and yaw rotation (default: rotasi kamera saat ini)"""
+        camera_rotation = self.camera_rotation if camera_rotation is None else camera_rotation
+        pitch = np.radians(camera_rotation['x'])  # rotation around X axis
+        yaw = np.radians(camera_rotation['y'])    # rotation around Y axis
         
         # Default forward direction is +Z (into the scene)
         # Apply yaw (Y-axis rotation) then pitch (X-axis rotation)
@@ -95,37 +257,66 @@ class Visualizer:
         
         return forward
     
-    def _draw_camera_path(self, ax, camera_points: List[List[float]], current_point: Optional[List[float]] = None):
-        """Draw camera translation path with waypoints"""
-        if len(camera_points) > 0:
-            for i, point in enumerate(camera_points):
-                if i == 0:
-                    label = "CAM_START"
-                    color = 'green'
-                elif i == len(camera_points) - 1 and len(camera_points) > 1:
-                    label = "CAM_END"
-                    color = 'red'
-                else:
-                    label = f"CAM_P{i}"
-                    color = 'purple'
-                
-                ax.scatter([point[0]], [point[1]], [point[2]], 
-                          c=color, s=100, marker='o', alpha=0.8, edgecolors='white', linewidths=2)
-                ax.text(point[0]+5, point[1]+5, point[2]+5, label, fontsize=8, fontweight='bold', color=color)
-            
-            if len(camera_points) > 1:
-                pts = np.array(camera_points)
-                ax.plot(pts[:, 0], pts[:, 1], pts[:, 2], 'purple', linewidth=2, alpha=0.6, linestyle='--')
+    def _set_labels(self, labels):
+        """
+        Perbarui label teks 3D di scene dari list (xyz, text, color, fontsize)
+        
+        Artist Text3D dipakai ulang dari pool; kelebihannya disembunyikan.
+        """
+        while len(self._labels) < len(labels):
+            text = self.ax_scene.text(0, 0, 0, '', fontweight='bold', animated=self._blit)
+            self._labels.append(text)
+        for text, (xyz, label, color, fontsize) in zip(self._labels, labels):
+            text.set_position_3d(xyz)
+            text.set_text(label)
+            text.set_color(color)
+            text.set_fontsize(fontsize)
+            text.set_visible(True)
+        for text in self._labels[len(labels):]:
+            text.set_visible(False)
+    
+    @staticmethod
+    def _set_scatter(scatter, points, colors=None, sizes=None):
+        """Perbarui posisi (N, 3) scatter 3D di tempat (_offsets3d), warna & ukuran opsional"""
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        scatter._offsets3d = (points[:, 0], points[:, 1], points[:, 2])
+        if colors is not None:
+            scatter.set_facecolor(colors)
+        if sizes is not None:
+            scatter.set_sizes(sizes)
+    
+    @staticmethod
+    def _set_line(line, points):
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        line.set_data_3d(points[:, 0], points[:, 1], points[:, 2])
+    
+    def _camera_path_labels(self, camera_points: List[List[float]], current_point: Optional[List[float]] = None):
+        """Update waypoint, garis dan label camera translation path; return list label"""
+        labels, colors = [], []
+        for i, point in enumerate(camera_points):
+            if i == 0:
+                label, color = "CAM_START", 'green'
+            elif i == len(camera_points) - 1 and len(camera_points) > 1:
+                label, color = "CAM_END", 'red'
+            else:
+                label, color = f"CAM_P{i}", 'purple'
+            colors.append(color)
+            labels.append(([point[0]+5, point[1]+5, point[2]+5], label, color, 8))
+        
+        self._set_scatter(self._artists["waypoints"], camera_points, colors or None)
+        self._set_line(self._artists["camera_path"], camera_points if len(camera_points) > 1 else [])
         
         if current_point is not None:
-            ax.scatter([current_point[0]], [current_point[1]], [current_point[2]], 
-                      c='orange', s=150, marker='*', alpha=1.0, edgecolors='white', linewidths=2)
-            ax.text(current_point[0]+5, current_point[1]+5, current_point[2]+5, 
-                   'NEW_CAM', fontsize=9, fontweight='bold', color='orange')
+            self._set_scatter(self._artists["current"], [current_point])
+            labels.append(([current_point[0]+5, current_point[1]+5, current_point[2]+5], 'NEW_CAM', 'orange', 9))
+        else:
+            self._set_scatter(self._artists["current"], [])
+        return labels
     
     def show_camera_translation_path(self, camera_points: List[List[float]], current_point: Optional[List[float]] = None, 
                                      camera_rotations: List[Dict] = None):
         """Show camera translation path with preview"""
+        self.generation += 1
         self._ensure_figure()
         
         all_coords = []
@@ -143,12 +334,12 @@ class Visualizer:
         
         limit = int(max_coord)
         
-        self._add_grid_3d(self.ax_scene, limit)
-        
-        self._draw_rocket_3d(self.ax_scene, [0, 0, 0], {"x": 0, "y": 0}, quality="fast")
-        self.ax_scene.text(5, 5, 5, 'ROCKET', fontsize=10, fontweight='bold', color='blue')
+        self._set_scene_limit(limit)
         
-        self._draw_camera_path(self.ax_scene, camera_points, current_point)
+        self._update_rockets_3d([([0, 0, 0], {"x": 0, "y": 0})], quality="fast")
+        labels = [([5, 5, 5], 'ROCKET', 'blue', 10)]
+        labels += self._camera_path_labels(camera_points, current_point)
+        self._set_line(self._artists["object_path"], [])
         
         display_cam_pos = current_point if current_point else (camera_points[-1] if camera_points else self.camera_position.tolist())
         display_cam_rot = camera_rotations[-1] if camera_rotations and len(camera_rotations) > 0 else self.camera_rotation
@@ -157,60 +348,40 @@ class Visualizer:
         if isinstance(display_cam_rot, dict):
             self.set_camera_rotation(display_cam_rot.get('x', 0), display_cam_rot.get('y', 0))
         
-        self._draw_camera_indicator(self.ax_scene, [0, 0, 0], limit)
+        self._update_camera_indicator([0, 0, 0], limit)
+        self._set_labels(labels)
         
-        self.ax_scene.set_title('Scene 3D - Camera Translation Path', fontsize=10)
+        self._artists["scene_title"].set_text('Scene 3D - Camera Translation Path')
         
-        self.ax_camera.set_facecolor('white')
-        self.ax_camera.set_xlim([-2, 2])
-        self.ax_camera.set_ylim([-1.5, 1.5])
-        self.ax_camera.set_aspect('equal')
-        self.ax_camera.grid(True, alpha=0.3)
-        self.ax_camera.set_xlabel('X')
-        self.ax_camera.set_ylabel('Y')
-        
-        self._render_rocket_to_camera_view(self.ax_camera, [0, 0, 0], {"x": 0, "y": 0}, quality="fast")
+        self._render_rocket_to_camera_view(self.ax_camera, [([0, 0, 0], {"x": 0, "y": 0})], quality="fast")
         
         cam_pos = self.camera_position
         cam_rot = self.camera_rotation
         title = f'Camera View from Current Position\n'
         title += f'Cam Pos: ({cam_pos[0]:.0f}, {cam_pos[1]:.0f}, {cam_pos[2]:.0f}) | '
         title += f'Cam Rot: Pitch={cam_rot["x"]:.0f}° Yaw={cam_rot["y"]:.0f}°'
-        self.ax_camera.set_title(title, fontsize=9)
+        self._artists["camera_title"].set_text(title)
         
-        self.fig.canvas.draw_idle()
-        self.fig.canvas.flush_events()
-        plt.pause(0.001)
+        self._present()
     
-    def _draw_camera_indicator(self, ax, rocket_position: List[float], limit=50):
-        """Draw camera as sphere with X marker showing VIEW DIRECTION (based on pitch/yaw)"""
+    def _update_camera_indicator(self, rocket_position: List[float], limit=50):
+        """Update camera sphere, arrow VIEW DIRECTION (pitch/yaw), X marker dan label di tempat"""
         cam_x, cam_y, cam_z = self.camera_position
+        center = np.array([cam_x, cam_y, cam_z], dtype=float)
         
-        # Draw camera sphere
+        # Camera sphere: quad grid 15x10 seperti plot_surface sebelumnya
         u = np.linspace(0, 2 * np.pi, 15)
         v = np.linspace(0, np.pi, 10)
         cam_radius = max(limit * 0.1, 10)
-        sphere_x = cam_x + cam_radius * np.outer(np.cos(u), np.sin(v))
-        sphere_y = cam_y + cam_radius * np.outer(np.sin(u), np.sin(v))
-        sphere_z = cam_z + cam_radius * np.outer(np.ones(np.size(u)), np.cos(v))
-        ax.plot_surface(sphere_x, sphere_y, sphere_z, color='purple', alpha=0.8)
+        sphere = center + cam_radius * np.stack((np.outer(np.cos(u), np.sin(v)),
+                                                 np.outer(np.sin(u), np.sin(v)),
+                                                 np.outer(np.ones(np.size(u)), np.cos(v))), axis=-1)
+        quads = np.stack((sphere[:-1, :-1], sphere[1:, :-1], sphere[1:, 1:], sphere[:-1, 1:]), axis=2)
+        self._artists["camera_sphere"].set_verts(quads.reshape(-1, 4, 3))
         
         forward = self._get_camera_view_direction()
         
-        # Draw arrow showing camera view direction
-        arrow_len = max(limit * 0.4, 30)
-        ax.quiver(cam_x, cam_y, cam_z, 
-                  forward[0]*arrow_len, forward[1]*arrow_len, forward[2]*arrow_len,
-                  color='cyan', arrow_length_ratio=0.15, linewidth=3)
-        
-        # X marker position at end of arrow
-        x_center = np.array([
-            cam_x + forward[0] * (cam_radius + arrow_len * 0.9),
-            cam_y + forward[1] * (cam_radius + arrow_len * 0.9),
-            cam_z + forward[2] * (cam_radius + arrow_len * 0.9)
-        ])
-        
-        # Get perpendicular vectors for X marker (perpendicular to view direction)
+        # Get perpendicular vectors (perpendicular to view direction)
         world_up = np.array([0, 1, 0])
         if abs(np.dot(forward, world_up)) > 0.9:
             world_up = np.array([1, 0, 0])
@@ -220,79 +391,99 @@ class Visualizer:
         up = np.cross(right, forward)
         up = up / np.linalg.norm(up)
         
-        # Draw X marker with two diagonal lines
-        x_size = cam_radius * 0.8
-        
-        # First diagonal (yellow)
-        p1_start = x_center - right * x_size + up * x_size
-        p1_end = x_center + right * x_size - up * x_size
-        ax.plot([p1_start[0], p1_end[0]], [p1_start[1], p1_end[1]], [p1_start[2], p1_end[2]], 
-                color='yellow', linewidth=6, alpha=1.0)
+        # Arrow showing camera view direction: batang + 2 garis kepala panah
+        arrow_len = max(limit * 0.4, 30)
+        tip = center + forward * arrow_len
+        head = arrow_len * 0.15
+        self._artists["camera_arrow"].set_segments([
+            [center, tip],
+            [tip, tip - head * (np.cos(0.5) * forward + np.sin(0.5) * up)],
+            [tip, tip - head * (np.cos(0.5) * forward - np.sin(0.5) * up)]
+        ])
         
-        # Second diagonal (yellow)
-        p2_start = x_center + right * x_size + up * x_size
-        p2_end = x_center - right * x_size - up * x_size
-        ax.plot([p2_start[0], p2_end[0]], [p2_start[1], p2_end[1]], [p2_start[2], p2_end[2]], 
-                color='yellow', linewidth=6, alpha=1.0)
+        # X marker position at end of arrow
+        x_center = center + forward * (cam_radius + arrow_len * 0.9)
+        x_size = cam_radius * 0.8
+        self._set_line(self._artists["camera_x1"], [x_center - right * x_size + up * x_size,
+                                                    x_center + right * x_size - up * x_size])
+        self._set_line(self._artists["camera_x2"], [x_center + right * x_size + up * x_size,
+                                                    x_center - right * x_size - up * x_size])
         
         # Camera label with coordinates and rotation info
         pitch_deg = self.camera_rotation['x']
         yaw_deg = self.camera_rotation['y']
-        ax.text(cam_x, cam_y - cam_radius - 8, cam_z, 
-                f'CAM\n({cam_x:.0f},{cam_y:.0f},{cam_z:.0f})\nP:{pitch_deg:.0f}° Y:{yaw_deg:.0f}°', 
-                fontsize=7, fontweight='bold', color='purple', ha='center')
+        label = self._artists["camera_label"]
+        label.set_position_3d((cam_x, cam_y - cam_radius - 8, cam_z))
+        label.set_text(f'CAM\n({cam_x:.0f},{cam_y:.0f},{cam_z:.0f})\nP:{pitch_deg:.0f}° Y:{yaw_deg:.0f}°')
     
-    def _draw_rocket_3d(self, ax, position: List[float], rotation: Dict, quality: str = "fast"):
-        """Draw rocket model in 3D space - improved solid appearance"""
-        y_i, x_i, z_i = self._cached_indices
-        
-        if len(y_i) == 0:
+    def _transform_voxels(self, x, y, z, position: List[float], rotation: Dict):
+        """
+        Transform batch voxel (Ry @ Rx di sekitar centroid) ke posisi preview
+        
+        Preview memakai konvensi pitch yang berlawanan tanda dengan Transform,
+        sehingga pitch dinegasikan di sini.
+        
+        Returns:
+            array (N, 3) koordinat world
+        """
+        matrix = self._preview_matrix(position, rotation)
+        points = np.column_stack((x, y, z)).astype(float)
+        return points @ matrix[:3, :3].T + matrix[:3, 3]
+    
+    def _preview_matrix(self, position: List[float], rotation: Dict):
+        """Matriks affine 4x4 (Transform) rocket preview di position/rotation"""
+        cx, cy, cz = self.rocket_centroid
+        transform = Transform()
+        transform.set_rotation_degrees(yaw=rotation.get('y', 0), pitch=-rotation.get('x', 0), roll=0)
+        transform.set_translation(position[0] - cx, position[1] - cy, position[2] - cz)
+        return transform.get_matrix(cx, cy, cz)
+    
+    def _update_rockets_3d(self, placements, quality: str = "fast"):
+        """Update satu scatter 3D berisi sampel voxel semua rocket (list (position, rotation))"""
+        self._set_rockets_3d(self._rocket_samples(placements, quality), quality)
+    
+    def _set_rockets_3d(self, samples, quality: str = "fast"):
+        """Isi scatter rocket dari hasil _rocket_samples (world, colors) atau None"""
+        scatter = self._artists["rockets"]
+        if samples is None:
+            self._set_scatter(scatter, [])
             return
-        
-        total_voxels = len(y_i)
+        world, colors = samples
+        self._set_scatter(scatter, world, colors)
+        scatter.set_sizes([8 if quality == "fast" else 12])
+    
+    def _rocket_samples(self, placements, quality: str = "fast"):
+        """
+        Sampel voxel semua rocket dalam koordinat world untuk scatter 3D
+        
+        Hanya NumPy (aman di thread worker). Return (world (N, 3), colors (N, 3)
+        float 0-1), atau None jika model belum siap / tidak ada rocket.
+        """
+        points = self._scene_points
+        if not self.ready or len(points) == 0 or len(placements) == 0:
+            return None
+        
+        total_voxels = len(points)
         sample_size = min(total_voxels, 2500) if quality == "fast" else min(total_voxels, 10000)
         
         step = max(1, total_voxels // sample_size)
         sample_indices = np.arange(0, total_voxels, step)[:sample_size]
         
         # Vectorized transformation for speed
-        y_samples = y_i[sample_indices]
-        x_samples = x_i[sample_indices]
-        z_samples = z_i[sample_indices]
+        x_samples, y_samples, z_samples = points[sample_indices].T
         
-        colors = self.voxel_data[y_samples, x_samples, z_samples].astype(float) / 255.0
+        colors = self._scene_colors[sample_indices].astype(float) / 255.0
         
-        # Local coordinates
-        x_local = x_samples - self.rocket_centroid[0]
-        y_local = y_samples - self.rocket_centroid[1]
-        z_local = z_samples - self.rocket_centroid[2]
-        
-        # Rotation matrix
-        rx = np.radians(rotation.get('x', 0))
-        ry = np.radians(rotation.get('y', 0))
-        
-        cos_rx, sin_rx = np.cos(rx), np.sin(rx)
-        cos_ry, sin_ry = np.cos(ry), np.sin(ry)
-        
-        # Apply Ry @ Rx rotation
-        x1 = cos_ry * x_local + sin_ry * z_local
-        y1 = sin_rx * (-sin_ry * x_local + cos_ry * z_local) + cos_rx * y_local
-        z1 = cos_rx * (-sin_ry * x_local + cos_ry * z_local) - sin_rx * y_local
-        
-        # World coordinates
-        world_x = position[0] + x1
-        world_y = position[1] + y1
-        world_z = position[2] + z1
-        
-        point_size = 8 if quality == "fast" else 12
-        ax.scatter(world_x, world_y, world_z, c=colors, s=point_size, marker='s', 
-                   alpha=0.9, edgecolors='none', depthshade=True)
+        world = np.concatenate([self._transform_voxels(x_samples, y_samples, z_samples, position, rotation)
+                                for position, rotation in placements])
+        return world, np.tile(colors, (len(placements), 1))
     
-    def _get_camera_transform(self, rocket_position: List[float]):
-        """Get camera transformation matrix based on camera rotation"""
-        cam_pos = self.camera_position
+    def _get_camera_transform(self, rocket_position: List[float], camera=None):
+        """Get camera transformation matrix based on camera rotation (camera: (position, rotation), default kamera saat ini)"""
+        cam_pos, cam_rot = camera if camera is not None else (self.camera_position, self.camera_rotation)
+        cam_pos = np.asarray(cam_pos, dtype=float)
         
-        forward = self._get_camera_view_direction()
+        forward = self._get_camera_view_direction(cam_rot)
         
         world_up = np.array([0, 1, 0])
         if abs(np.dot(forward, world_up)) > 0.9:
@@ -314,117 +505,168 @@ class Visualizer:
         
         return view_matrix, cam_pos
     
-    def _render_rocket_to_camera_view(self, ax, position: List[float], rotation: Dict, quality: str = "fast"):
-        """Render what camera actually sees with depth buffer"""
-        view_matrix, cam_pos = self._get_camera_transform(position)
-        
-        y_i, x_i, z_i = self._cached_indices
-        if len(y_i) == 0:
-            return
-        
-        fov_rad = np.radians(self.fov)
+    # Batas NDC yang terlihat di panel Camera POV (x dan y)
+    camera_view_extent = 1.5
+    
+    def _camera_view_image(self, placements, resolution=120, camera=None, quality: str = "fast"):
+        """
+        Proyeksikan voxel aktif setiap rocket ke image RGBA kecil (array)
+        
+        placements: list (position, rotation). Semua rocket berbagi satu
+        z-buffer array: setiap voxel menjadi kotak k x k pixel (k = ukuran
+        proyeksi voxel, 1-3 pixel), voxel terdekat menang (np.minimum.at).
+        Pixel kosong transparan (alpha 0). quality="fast" memakai level LOD
+        camera_view_lod, quality lain semua voxel.
+        camera: (position, rotation) kamera; default kamera saat ini.
+        Return (image (size, size, 4) uint8, jumlah pixel terisi).
+        """
+        view_matrix, cam_pos = self._get_camera_transform(placements[0][0] if placements else [0, 0, 0], camera)
+        extent = self.camera_view_extent
+        size = int(round(2 * extent * resolution))
+        image = np.zeros((size, size, 4), dtype=np.uint8)
+        
+        if not self.ready or len(placements) == 0:
+            return image, 0
+        points, voxel_colors, scale = self._camera_sets["fast" if quality == "fast" else "full"]
+        if len(points) == 0:
+            return image, 0
+        
+        f = 1.0 / np.tan(np.radians(self.fov) / 2)
         aspect = 4.0 / 3.0
-        f = 1.0 / np.tan(fov_rad / 2)
         
-        resolution = 120 if quality == "fast" else 180
-        depth_buffer = {}
-        pixel_colors = {}
-        
-        total_voxels = len(y_i)
-        sample_size = min(total_voxels, 6000) if quality == "fast" else min(total_voxels, 20000)
-        
-        step = max(1, total_voxels // sample_size)
-        sample_indices = np.arange(0, total_voxels, step)[:sample_size]
-        
-        # Rotation matrices
-        rx = np.radians(rotation.get('x', 0))
-        ry = np.radians(rotation.get('y', 0))
-        cos_rx, sin_rx = np.cos(rx), np.sin(rx)
-        cos_ry, sin_ry = np.cos(ry), np.sin(ry)
-        
-        for idx in sample_indices:
-            y, x, z = y_i[idx], x_i[idx], z_i[idx]
-            color = self.voxel_data[y, x, z] / 255.0
-            
-            # Transform to world space
-            x_local = x - self.rocket_centroid[0]
-            y_local = y - self.rocket_centroid[1]
-            z_local = z - self.rocket_centroid[2]
-            
-            # Apply rotation
-            x1 = cos_ry * x_local + sin_ry * z_local
-            y1 = sin_rx * (-sin_ry * x_local + cos_ry * z_local) + cos_rx * y_local
-            z1 = cos_rx * (-sin_ry * x_local + cos_ry * z_local) - sin_rx * y_local
-            
-            world_pos = np.array([position[0] + x1, position[1] + y1, position[2] + z1])
+        pixels, depths, owners = [], [], []
+        for position, rotation in placements:
+            # Transform rocket + view kamera digabung menjadi satu matmul
+            matrix = self._preview_matrix(position, rotation)
+            linear = (view_matrix @ matrix[:3, :3]).astype(np.float32)
+            offset = (view_matrix @ (matrix[:3, 3] - cam_pos)).astype(np.float32)
+            cam_x, cam_y, cam_z = (points @ linear.T + offset).T
             
-            # Transform to camera space
-            relative_pos = world_pos - cam_pos
-            cam_space = view_matrix @ relative_pos
-            
-            cam_x, cam_y, cam_z = cam_space[0], cam_space[1], cam_space[2]
-            
-            if cam_z <= 1.0:
-                continue
-            
-            x_ndc = (f * cam_x) / (cam_z * aspect)
-            y_ndc = (f * cam_y) / cam_z
-            
-            if abs(x_ndc) > 1.5 or abs(y_ndc) > 1.5:
-                continue
-            
-            px = int(x_ndc * resolution)
-            py = int(y_ndc * resolution)
-            pixel_key = (px, py)
-            
-            if pixel_key not in depth_buffer or cam_z < depth_buffer[pixel_key]:
-                depth_buffer[pixel_key] = cam_z
-                pixel_colors[pixel_key] = color
-        
-        if len(pixel_colors) > 0:
-            px_coords = np.array([k[0] for k in pixel_colors.keys()]) / resolution
-            py_coords = np.array([k[1] for k in pixel_colors.keys()]) / resolution
-            colors = np.array(list(pixel_colors.values()))
-            ax.scatter(px_coords, py_coords, c=colors, s=6, marker='s', alpha=0.95, edgecolors='none')
-        else:
-            ax.text(0, 0, 'No object in view', ha='center', va='center', 
-                   fontsize=12, color='gray', style='italic')
+            front = cam_z > 1.0
+            x_ndc = (f * cam_x[front]) / (cam_z[front] * aspect)
+            y_ndc = (f * cam_y[front]) / cam_z[front]
+            depth = cam_z[front]
+            # Ukuran kotak splat: tinggi proyeksi voxel (scale voxel asli) dalam pixel
+            block = np.clip((scale * f * resolution / depth).astype(np.int64), 1, 3)
+            ids = np.flatnonzero(front)
+            for k in np.unique(block):
+                group = block == k
+                col = np.floor((x_ndc[group] + extent) * resolution - (k - 1) / 2).astype(np.int64)
+                row = np.floor((y_ndc[group] + extent) * resolution - (k - 1) / 2).astype(np.int64)
+                # Kotak yang terpotong tepi image dibuang utuh (hanya pixel di tepi)
+                inside = (col >= 0) & (col + k <= size) & (row >= 0) & (row + k <= size)
+                offsets = (np.arange(k)[:, None] * size + np.arange(k)).ravel()
+                pixels.append(((row[inside] * size + col[inside])[:, None] + offsets).ravel())
+                depths.append(np.repeat(depth[group][inside], k * k))
+                owners.append(np.repeat(ids[group][inside], k * k))
+        pixels, depths, owners = np.concatenate(pixels), np.concatenate(depths), np.concatenate(owners)
+        if len(pixels) == 0:
+            return image, 0
+        
+        # Z-buffer array: depth minimum per pixel, lalu warna voxel yang mencapainya
+        depth_buffer = np.full(size * size, np.inf, dtype=depths.dtype)
+        np.minimum.at(depth_buffer, pixels, depths)
+        winner = depths == depth_buffer[pixels]
+        flat = image.reshape(-1, 4)
+        flat[pixels[winner], :3] = voxel_colors[owners[winner]]
+        flat[pixels[winner], 3] = 255
+        return image, int(np.isfinite(depth_buffer).sum())
+    
+    def _render_rocket_to_camera_view(self, ax, placements, quality: str = "fast"):
+        """
+        Render what camera actually sees (z-buffer array) ke artist imshow (set_data)
+        
+        placements: list (position, rotation) rocket yang digambar bersama.
+        """
+        resolution = 120 if quality == "fast" else 180
+        image, filled = self._camera_view_image(placements, resolution, quality=quality)
+        self._set_camera_view(image, filled, len(placements))
+    
+    def _set_camera_view(self, image, filled, rocket_count):
+        """Tampilkan image Camera POV; teks placeholder jika kosong atau model belum siap"""
+        self._artists["camera_image"].set_data(image)
+        no_object = self._artists["no_object"]
+        no_object.set_text('No object in view' if self.ready else 'Loading model...')
+        no_object.set_visible((filled == 0 and rocket_count > 0) or not self.ready)
     
     def show_camera_setup_realtime(self, position: List[float], rotation: Dict):
         """Show camera setup with real-time rocket rendering"""
+        self.generation += 1
+        self.present_camera_setup(
+            self.prepare_camera_setup(position, rotation, self.camera_position, self.camera_rotation,
+                                      self.generation))
+    
+    def prepare_camera_setup(self, position: List[float], rotation: Dict,
+                             camera_position: List[float], camera_rotation: Dict, generation: int,
+                             quality: str = "fast"):
+        """
+        Hitung data preview camera setup (sampel scene 3D + image Camera POV)
+        
+        Tidak menyentuh matplotlib maupun state kamera visualizer, sehingga
+        aman dijalankan di thread worker; hasilnya ditampilkan dengan
+        present_camera_setup() di main thread. generation dibaca di main
+        thread saat permintaan dibuat (self.generation).
+        quality="full": Camera POV dari semua voxel (resolusi 180), dipakai
+        GUI setelah edit berhenti; "fast" memakai level LOD camera_view_lod.
+        """
+        camera = (np.array(camera_position, dtype=float), dict(camera_rotation))
+        placements = [(position, rotation)]
+        resolution = 120 if quality == "fast" else 180
+        return {
+            "generation": generation,
+            "quality": quality,
+            "position": position,
+            "rotation": rotation,
+            "camera": camera,
+            "rockets": self._rocket_samples(placements, quality=quality),
+            "camera_view": self._camera_view_image(placements, resolution, camera, quality=quality)
+        }
+    
+    def present_camera_setup(self, preview: Dict):
+        """
+        Tampilkan hasil prepare_camera_setup (main thread): update artist lalu blit/draw
+        
+        Return False (tidak menggambar) jika sejak permintaan dibuat sudah ada
+        show_* sinkron lain (generation berbeda), agar hasil worker yang
+        terlambat tidak menimpa tampilan yang lebih baru.
+        """
+        if preview["generation"] != self.generation:
+            return False
         self._ensure_figure()
+        position = preview["position"]
+        camera_position, camera_rotation = preview["camera"]
+        self.set_camera_position(*camera_position)
+        self.set_camera_rotation(camera_rotation["x"], camera_rotation["y"])
         
         limit = 150
-        self._add_grid_3d(self.ax_scene, limit)
+        self._set_scene_limit(limit)
         
-        self._draw_rocket_3d(self.ax_scene, position, rotation, quality="fast")
-        self._draw_camera_indicator(self.ax_scene, position, limit)
+        self._set_rockets_3d(preview["rockets"], quality=preview["quality"])
+        self._set_scatter(self._artists["waypoints"], [])
+        self._set_scatter(self._artists["current"], [])
+        self._set_line(self._artists["object_path"], [])
+        self._set_line(self._artists["camera_path"], [])
+        self._set_labels([])
+        self._update_camera_indicator(position, limit)
         
-        self.ax_scene.set_title('Scene 3D - Object Position & Rotation', fontsize=10)
+        self._artists["scene_title"].set_text('Scene 3D - Object Position & Rotation')
         
-        self.ax_camera.set_facecolor('white')
-        self.ax_camera.set_xlim([-2, 2])
-        self.ax_camera.set_ylim([-1.5, 1.5])
-        self.ax_camera.set_aspect('equal')
-        self.ax_camera.grid(True, alpha=0.3)
-        self.ax_camera.set_xlabel('X')
-        self.ax_camera.set_ylabel('Y')
-        
-        self._render_rocket_to_camera_view(self.ax_camera, position, rotation, quality="fast")
+        image, filled = preview["camera_view"]
+        self._set_camera_view(image, filled, 1)
         
         cam_rot = self.camera_rotation
         cam_pos = self.camera_position
         title = f'Camera View (2D Projection)\n'
         title += f'Cam Pos: ({cam_pos[0]:.0f}, {cam_pos[1]:.0f}, {cam_pos[2]:.0f}) | '
         title += f'Cam Rot: Pitch={cam_rot["x"]:.0f}° Yaw={cam_rot["y"]:.0f}°'
-        self.ax_camera.set_title(title, fontsize=9)
+        self._artists["camera_title"].set_text(title)
         
-        self.fig.canvas.draw_idle()
-        self.fig.canvas.flush_events()
-        plt.pause(0.001)
+        self._present()
+        return True
     
     def show_translation_with_rocket(self, points: List[List[float]], current_point: Optional[List[float]] = None, rotations: List[Dict] = None):
         """Show translation path with actual rocket models"""
+        self.generation += 1
         self._ensure_figure()
         
         all_coords = []
@@ -442,57 +684,50 @@ class Visualizer:
         
         limit = int(max_coord)
         
-        self._add_grid_3d(self.ax_scene, limit)
+        self._set_scene_limit(limit)
         
         if rotations is None:
             rotations = [{"x": 0, "y": 0} for _ in range(len(points) + (1 if current_point else 0))]
         
-        if len(points) > 0:
-            for i, point in enumerate(points):
-                rot = rotations[i] if i < len(rotations) else {"x": 0, "y": 0}
-                self._draw_rocket_3d(self.ax_scene, point, rot, quality="fast")
-                
-                if i == 0:
-                    label = "START"
-                elif i == len(points) - 1 and len(points) > 1:
-                    label = "END"
-                else:
-                    label = f"P{i}"
-                self.ax_scene.text(point[0]+10, point[1]+10, point[2]+10, label, fontsize=10, fontweight='bold')
+        placements, labels = [], []
+        for i, point in enumerate(points):
+            rot = rotations[i] if i < len(rotations) else {"x": 0, "y": 0}
+            placements.append((point, rot))
             
-            if len(points) > 1:
-                pts = np.array(points)
-                self.ax_scene.plot(pts[:, 0], pts[:, 1], pts[:, 2], 'k-', linewidth=2, alpha=0.5)
+            if i == 0:
+                label = "START"
+            elif i == len(points) - 1 and len(points) > 1:
+                label = "END"
+            else:
+                label = f"P{i}"
+            labels.append(([point[0]+10, point[1]+10, point[2]+10], label, 'black', 10))
+        
+        self._set_line(self._artists["object_path"], points if len(points) > 1 else [])
         
         if current_point is not None:
             rot = rotations[len(points)] if len(points) < len(rotations) else {"x": 0, "y": 0}
-            self._draw_rocket_3d(self.ax_scene, current_point, rot, quality="fast")
-            self.ax_scene.text(current_point[0]+10, current_point[1]+10, current_point[2]+10, 
-                              'NEW', fontsize=10, fontweight='bold', color='orange')
+            placements.append((current_point, rot))
+            labels.append(([current_point[0]+10, current_point[1]+10, current_point[2]+10], 'NEW', 'orange', 10))
         
-        rocket_pos = current_point if current_point else (points[-1] if points else [0, 0, 0])
-        self._draw_camera_indicator(self.ax_scene, rocket_pos, limit)
-        self.ax_scene.set_title('Scene 3D - Rocket Animation Path', fontsize=10)
+        self._update_rockets_3d(placements, quality="fast")
+        self._set_scatter(self._artists["waypoints"], [])
+        self._set_scatter(self._artists["current"], [])
+        self._set_line(self._artists["camera_path"], [])
+        self._set_labels(labels)
         
-        self.ax_camera.set_facecolor('white')
-        self.ax_camera.set_xlim([-2, 2])
-        self.ax_camera.set_ylim([-1.5, 1.5])
-        self.ax_camera.set_aspect('equal')
-        self.ax_camera.grid(True, alpha=0.3)
-        self.ax_camera.set_xlabel('X')
-        self.ax_camera.set_ylabel('Y')
+        rocket_pos = current_point if current_point else (points[-1] if points else [0, 0, 0])
+        self._update_camera_indicator(rocket_pos, limit)
+        self._artists["scene_title"].set_text('Scene 3D - Rocket Animation Path')
         
         all_display_points = points + ([current_point] if current_point else [])
         all_display_rots = rotations[:len(all_display_points)]
         
-        for i, (point, rot) in enumerate(zip(all_display_points, all_display_rots)):
-            self._render_rocket_to_camera_view(self.ax_camera, point, rot, quality="fast")
+        self._render_rocket_to_camera_view(self.ax_camera, list(zip(all_display_points, all_display_rots)),
+                                           quality="fast")
         
-        self.ax_camera.set_title('Camera View - What Camera Actually Sees', fontsize=9)
+        self._artists["camera_title"].set_text('Camera View - What Camera Actually Sees')
         
-        self.fig.canvas.draw_idle()
-        self.fig.canvas.flush_events()
-        plt.pause(0.001)
+        self._present()
     
     def close(self):
         plt.ioff()
@@ -501,3 +736,6 @@ class Visualizer:
             self.fig = None
             self.ax_scene = None
             self.ax_camera = None
+            self._artists = {}
+            self._labels = []
+            self._background = None